@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from scraper.schemas.scheduler_task import SchedulerTask
 
 
@@ -6,6 +8,8 @@ class ExecutorProcessFailure(Exception):
 	Exception raised when a task execution fails.
 	"""
 
+	__slots__ = ('task_log', 'message', 'task')
+
 	def __init__(
 		self,
 		message: str,
@@ -17,13 +21,33 @@ class ExecutorProcessFailure(Exception):
 		self.message = message
 		self.task = task
 
+	@cached_property
+	def _task_json(self) -> str:
+		return self.task.model_dump_json(indent=2)
+
 	def __str__(self) -> str:
-		return super().__str__() + (
-			f'\nTask Log:\n{self.task_log}\n'
-			f'Task:\n{self.task.model_dump_json(indent=2)}'
+		return '\n'.join(
+			(
+				super().__str__(),
+				'Task Log:',
+				self.task_log,
+				'Task:',
+				self._task_json,
+			)
 		)
 
 	def __repr__(self) -> str:
+		return (
+			f'{self.__class__.__name__}('
+			f'message={self.message!r}, '
+			f'task_id=0x{id(self.task):x})'
+		)
+
+	def verbose_repr(self) -> str:
+		"""
+		Full representation including the task payload,
+		for tooling that needs more than __repr__.
+		"""
 		return (
 			f'{self.__class__.__name__}('
 			f'message={self.message!r}, '
@@ -37,3 +61,5 @@ class ExecutorProcessingFailure(ExecutorProcessFailure):
 	Exception raised when a specific processing step
 	fails during task execution.
 	"""
+
+	__slots__ = ()
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from scraper.schemas.scheduler_task import (
 	SchedulerTask,
 	TaskResult,
@@ -10,6 +12,8 @@ class SchedulerProcessFailure(Exception):
 	during the scheduler process.
 	"""
 
+	__slots__ = ('task_log', 'message', 'task')
+
 	def __init__(
 		self,
 		message: str,
@@ -21,13 +25,33 @@ class SchedulerProcessFailure(Exception):
 		self.message = message
 		self.task = task
 
+	@cached_property
+	def _task_json(self) -> str:
+		return self.task.model_dump_json(indent=2)
+
 	def __str__(self) -> str:
-		return super().__str__() + (
-			f'\nTask Log:\n{self.task_log}\n'
-			f'Task:\n{self.task.model_dump_json(indent=2)}'
+		return '\n'.join(
+			(
+				super().__str__(),
+				'Task Log:',
+				self.task_log,
+				'Task:',
+				self._task_json,
+			)
 		)
 
 	def __repr__(self) -> str:
+		return (
+			f'{self.__class__.__name__}('
+			f'message={self.message!r}, '
+			f'task_id=0x{id(self.task):x})'
+		)
+
+	def verbose_repr(self) -> str:
+		"""
+		Full representation including the task payload,
+		for tooling that needs more than __repr__.
+		"""
 		return (
 			f'{self.__class__.__name__}('
 			f'message={self.message!r}, '
@@ -42,6 +66,8 @@ class SchedulerPhaseFailure(Exception):
 	during a scheduler phase.
 	"""
 
+	__slots__ = ('task_log', 'message', 'task_result')
+
 	def __init__(
 		self,
 		message: str,
@@ -53,15 +79,33 @@ class SchedulerPhaseFailure(Exception):
 		self.message = message
 		self.task_result = task_result
 
+	@cached_property
+	def _task_result_json(self) -> str:
+		return self.task_result.model_dump_json(indent=2)
+
 	def __str__(self) -> str:
-		return super().__str__() + (
-			f'\nTask Log:\n{self.task_log}\n'
-			f'Task Result:\n{
-				self.task_result.model_dump_json(indent=2)
-			}'
+		return '\n'.join(
+			(
+				super().__str__(),
+				'Task Log:',
+				self.task_log,
+				'Task Result:',
+				self._task_result_json,
+			)
 		)
 
 	def __repr__(self) -> str:
+		return (
+			f'{self.__class__.__name__}('
+			f'message={self.message!r}, '
+			f'task_result_id=0x{id(self.task_result):x})'
+		)
+
+	def verbose_repr(self) -> str:
+		"""
+		Full representation including the task result
+		payload, for tooling that needs more than __repr__.
+		"""
 		return (
 			f'{self.__class__.__name__}('
 			f'message={self.message!r}, '
@@ -77,6 +121,14 @@ class SchedulerDiscoveryTypeMismatch(Exception):
 	type returned by a task.
 	"""
 
+	__slots__ = (
+		'message',
+		'target_type',
+		'observed_type',
+		'task_log',
+		'task_result',
+	)
+
 	def __init__(
 		self,
 		message: str,
@@ -92,17 +144,37 @@ class SchedulerDiscoveryTypeMismatch(Exception):
 		self.task_log = task_log
 		self.task_result = task_result
 
+	@cached_property
+	def _task_result_json(self) -> str:
+		return self.task_result.model_dump_json(indent=2)
+
 	def __str__(self) -> str:
-		return super().__str__() + (
-			f'\nExpected Type: {self.target_type}\n'
-			f'Observed Type: {self.observed_type}\n'
-			f'Task Log:\n{self.task_log}\n'
-			f'Task Result:\n{
-				self.task_result.model_dump_json(indent=2)
-			}'
+		return '\n'.join(
+			(
+				super().__str__(),
+				f'Expected Type: {self.target_type}',
+				f'Observed Type: {self.observed_type}',
+				'Task Log:',
+				self.task_log,
+				'Task Result:',
+				self._task_result_json,
+			)
 		)
 
 	def __repr__(self) -> str:
+		return (
+			f'{self.__class__.__name__}('
+			f'message={self.message!r}, '
+			f'target_type={self.target_type!r}, '
+			f'observed_type={self.observed_type!r}, '
+			f'task_result_id=0x{id(self.task_result):x})'
+		)
+
+	def verbose_repr(self) -> str:
+		"""
+		Full representation including the task result
+		payload, for tooling that needs more than __repr__.
+		"""
 		return (
 			f'{self.__class__.__name__}('
 			f'message={self.message!r}, '
@@ -1,6 +1,8 @@
 class ScrapingError(Exception):
 	"""Base class for scraping-related errors."""
 
+	__slots__ = ('task_log', 'page_url')
+
 	def __init__(
 		self,
 		message: str,
@@ -36,10 +38,16 @@ class ScrapingError(Exception):
 class ScrapeClientError(ScrapingError):
 	"""Browser/context lifecycle failure."""
 
+	__slots__ = ()
+
 
 class RetryableScrapeError(ScrapingError):
 	"""A scrape attempt failed but may succeed on retry."""
 
+	__slots__ = ()
+
 
 class FatalScrapeError(ScrapingError):
 	"""Scrape failed permanently or retries exhausted."""
+
+	__slots__ = ()
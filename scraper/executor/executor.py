@@ -5,11 +5,18 @@ tasks using the appropriate handlers and managing the
 overall scraping workflow.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, NoReturn, TypeVar
 
 from scraper.exceptions.executor import (
 	ExecutorProcessFailure,
 )
+from scraper.exceptions.scraper import ScrapingError
 from scraper.executor.handlers.agencies_handler import (
 	AgenciesHandler,
 )
@@ -24,7 +31,6 @@ from scraper.executor.handlers.services_handler import (
 	ServicesHandler,
 )
 from scraper.schemas.scheduler_task import (
-	MinistryIdentifier,
 	SchedulerTask,
 	ScrapingPhase,
 	TaskOperation,
@@ -35,6 +41,110 @@ from scraper.utils.logging import get_task_log
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Scrape operations only write raw HTML, which is on
+# disk once they return, so their handler state saves
+# can be debounced. Every other operation mutates
+# handler state the scheduler will record as done, so
+# it is flushed before the task result is returned
+_DEBOUNCED_SAVE_OPERATIONS = frozenset(
+	{
+		TaskOperation.FAQ_SCRAPE,
+		TaskOperation.AGENCIES_LIST_SCRAPE,
+		TaskOperation.MINISTRIES_LIST_SCRAPE,
+		TaskOperation.MINISTRIES_PAGE_SCRAPE,
+		TaskOperation.MINISTRIES_SERVICES_SCRAPE,
+	}
+)
+
+# --- Log messages --- #
+
+_MSG_FAQ_SCRAPE_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting FAQ page scrape task.'
+)
+_MSG_FAQ_PROCESS_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting FAQ page process task.'
+)
+_MSG_AGENCIES_LIST_SCRAPE_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting agencies list '
+	'scrape task.'
+)
+_MSG_AGENCIES_LIST_PROCESS_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting agencies list '
+	'process task.'
+)
+_MSG_MINISTRIES_LIST_SCRAPE_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries list '
+	'scrape task.'
+)
+_MSG_MINISTRIES_LIST_PROCESS_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries list '
+	'process task.'
+)
+_MSG_MINISTRIES_PAGE_SCRAPE_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries page '
+	'scrape task.'
+)
+_MSG_MINISTRIES_PAGE_PROCESS_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries page '
+	'process task.'
+)
+_MSG_MINISTRIES_SERVICES_SCRAPE_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries services '
+	'scrape task.'
+)
+_MSG_MINISTRIES_SERVICES_PROCESS_START = (
+	'[EXECUTOR]\n'
+	'[TASK INFO]: Starting ministries services '
+	'process task.'
+)
+_MSG_FINALISATION_START = (
+	'[EXECUTOR]\n[TASK INFO]: Starting finalisation task.'
+)
+_MSG_FINALISATION_DONE = (
+	'[EXECUTOR]\n[TASK INFO]: Finalisation task completed.'
+)
+_MSG_TASK_SUCCESS = (
+	'[EXECUTOR]\n[TASK INFO]: Task executed successfully.'
+)
+_MSG_TASK_FAILURE = (
+	'[EXECUTOR]\n[TASK ERROR]: Error executing task.'
+)
+
+
+def _log_info(message: str, task_log: str) -> None:
+	"""
+	Emit an INFO log for a task, skipping the extra
+	dict allocation when INFO is disabled.
+	"""
+	if logger.isEnabledFor(logging.INFO):
+		logger.info(message, extra={'task': task_log})
+
+
+def _unrecognized(
+	task: SchedulerTask, task_log: str
+) -> NoReturn:
+	"""
+	Raise the failure for a task whose scope and
+	operation pair has no registered handler.
+	"""
+	raise ExecutorProcessFailure(
+		f'Unrecognized operation {task.operation.value} '
+		f'for {task.scope.value} scope.',
+		task=task,
+		task_log=task_log,
+	)
+
 
 class Executor:
 	"""
@@ -42,7 +152,32 @@ class Executor:
 	for executing scheduled tasks.
 	"""
 
-	def __init__(self) -> None:
+	def __init__(
+		self,
+		max_in_flight: int = 8,
+		save_every: int = 10,
+		save_interval: float = 5.0,
+	) -> None:
+		# Bound on concurrently executing tasks, so
+		# callers gathering many tasks get backpressure
+		# instead of pinning every task in memory
+		self._semaphore = asyncio.Semaphore(max_in_flight)
+
+		# Debounced handler state saves, flushed every
+		# save_every tasks or save_interval seconds
+		self._save_every = save_every
+		self._save_interval = save_interval
+		self._save_lock = asyncio.Lock()
+		self._unsaved_tasks = 0
+		self._last_save = time.monotonic()
+
+		# Bounded worker pool shared by all handlers for
+		# state IO and other blocking handler work
+		self._io_pool = ThreadPoolExecutor(
+			max_workers=2,
+			thread_name_prefix='handler-io',
+		)
+
 		# Scrape client for managing browser
 		# interactions
 		self.scrape_client = ScrapeClient()
@@ -53,396 +188,420 @@ class Executor:
 		self.ministries_handler = MinistriesHandler()
 		self.departments_handler = DepartmentsHandler()
 		self.services_handler = ServicesHandler()
+		self._handlers = (
+			self.faq_handler,
+			self.agencies_handler,
+			self.ministries_handler,
+			self.departments_handler,
+			self.services_handler,
+		)
 
-		# Scope to handler mapping for routing tasks to the
-		self.scope_handler_mapping = {
-			ScrapingPhase.FAQ: self._faq_scope,
-			ScrapingPhase.AGENCIES_LIST: (
-				self._agencies_scope
-			),
-			ScrapingPhase.MINISTRIES_LIST: (
-				self._ministries_list_scope
-			),
-			ScrapingPhase.MINISTRIES_PAGES: (
-				self._ministries_page_scope
-			),
-			ScrapingPhase.MINISTRIES_SERVICES: (
-				self._services_scope
-			),
-			ScrapingPhase.FINALISATION: (
-				self._finalisation_scope
-			),
+		# (scope, operation) to coroutine mapping for
+		# routing tasks to the appropriate handler method
+		self._dispatch: dict[
+			tuple[ScrapingPhase, TaskOperation],
+			Callable[
+				[SchedulerTask, str], Awaitable[TaskResult]
+			],
+		] = {
+			(
+				ScrapingPhase.FAQ,
+				TaskOperation.FAQ_SCRAPE,
+			): self._do_faq_scrape,
+			(
+				ScrapingPhase.FAQ,
+				TaskOperation.FAQ_PROCESS,
+			): self._do_faq_process,
+			(
+				ScrapingPhase.AGENCIES_LIST,
+				TaskOperation.AGENCIES_LIST_SCRAPE,
+			): self._do_agencies_list_scrape,
+			(
+				ScrapingPhase.AGENCIES_LIST,
+				TaskOperation.AGENCIES_LIST_PROCESS,
+			): self._do_agencies_list_process,
+			(
+				ScrapingPhase.MINISTRIES_LIST,
+				TaskOperation.MINISTRIES_LIST_SCRAPE,
+			): self._do_ministries_list_scrape,
+			(
+				ScrapingPhase.MINISTRIES_LIST,
+				TaskOperation.MINISTRIES_LIST_PROCESS,
+			): self._do_ministries_list_process,
+			(
+				ScrapingPhase.MINISTRIES_PAGES,
+				TaskOperation.MINISTRIES_PAGE_SCRAPE,
+			): self._do_ministries_page_scrape,
+			(
+				ScrapingPhase.MINISTRIES_PAGES,
+				TaskOperation.MINISTRIES_PAGE_PROCESS,
+			): self._do_ministries_page_process,
+			(
+				ScrapingPhase.MINISTRIES_SERVICES,
+				TaskOperation.MINISTRIES_SERVICES_SCRAPE,
+			): self._do_ministries_services_scrape,
+			(
+				ScrapingPhase.MINISTRIES_SERVICES,
+				TaskOperation.MINISTRIES_SERVICES_PROCESS,
+			): self._do_ministries_services_process,
+			(
+				ScrapingPhase.FINALISATION,
+				TaskOperation.FINALISATION_CHECKS,
+			): self._do_finalisation_checks,
 		}
 
 	@classmethod
-	async def create(cls) -> 'Executor':
+	async def create(
+		cls,
+		max_in_flight: int = 8,
+		save_every: int = 10,
+		save_interval: float = 5.0,
+	) -> 'Executor':
 		"""
 		Class method to create an instance of the Executor
 		with any necessary asynchronous initialization.
 		"""
-		executor = cls()
+		executor = cls(
+			max_in_flight=max_in_flight,
+			save_every=save_every,
+			save_interval=save_interval,
+		)
 		await executor.initialise()
 		return executor
 
 	async def initialise(self) -> None:
 		"""
 		Method to perform any asynchronous initialization
-		required for the executor.
+		required for the executor. Browser start-up and
+		any handler async_init hooks run concurrently.
 		"""
-		if not self.scrape_client._browser:
-			await self.scrape_client.init_browser()
+		await asyncio.gather(
+			self.scrape_client.init_browser(),
+			*(
+				handler.async_init()
+				for handler in self._handlers
+				if hasattr(handler, 'async_init')
+			),
+		)
 
 	# --- Handler state management methods --- #
 
-	def save_handlers_state(self) -> None:
+	async def save_handlers_state(self) -> None:
+		"""
+		Method to save the state of all handlers. Each
+		handler writes its own files, so the saves run
+		concurrently on the shared handler IO pool.
+		"""
+		await asyncio.gather(
+			*(
+				self._run_in_io_pool(handler.save_state)
+				for handler in self._handlers
+			)
+		)
+
+	async def flush_handlers_state(self) -> None:
 		"""
-		Method to save the state of all handlers.
+		Method to save the state of all handlers if any
+		task has completed since the last save.
 		"""
-		self.faq_handler.save_state()
-		self.agencies_handler.save_state()
-		self.ministries_handler.save_state()
-		self.departments_handler.save_state()
-		self.services_handler.save_state()
+		async with self._save_lock:
+			if not self._unsaved_tasks:
+				return
+			# Reset before saving so tasks completing
+			# during the save are picked up next flush
+			self._unsaved_tasks = 0
+			self._last_save = time.monotonic()
+			await self.save_handlers_state()
+
+	async def _schedule_save(
+		self, *, immediate: bool = False
+	) -> None:
+		"""
+		Method to record a completed task and flush
+		handler state once enough tasks or time have
+		accumulated since the last save, or straight
+		away when immediate is set.
+		"""
+		self._unsaved_tasks += 1
+		if immediate:
+			# Wait out any save in progress, it may have
+			# started before this task's changes
+			await self.flush_handlers_state()
+			return
+		if self._save_lock.locked():
+			return
+		elapsed = time.monotonic() - self._last_save
+		if (
+			self._unsaved_tasks >= self._save_every
+			or elapsed >= self._save_interval
+		):
+			await self.flush_handlers_state()
 
 	async def close(self) -> None:
 		"""
 		Method to close any resources held by the executor,
-		such as the scrape client's browser instance.
+		such as the scrape client's browser instance. Any
+		unsaved handler state is flushed first.
 		"""
-		await self.scrape_client.close_browser()
+		try:
+			await self.flush_handlers_state()
+		finally:
+			self._io_pool.shutdown(wait=False)
+			for handler in self._handlers:
+				if hasattr(handler, 'close'):
+					handler.close()
+			await self.scrape_client.close_browser()
+
+	def _run_in_io_pool(
+		self,
+		fn: Callable[..., T],
+		/,
+		*args: Any,
+		**kwargs: Any,
+	) -> Awaitable[T]:
+		"""
+		Method to run blocking handler work on the shared
+		handler IO pool without blocking the event loop.
+		"""
+		loop = asyncio.get_running_loop()
+		return loop.run_in_executor(
+			self._io_pool,
+			partial(fn, *args, **kwargs),
+		)
 
-	# --- Scope-specific task execution methods --- #
+	# --- Operation-specific task execution methods --- #
 
-	async def _faq_scope(
-		self, task: SchedulerTask
+	async def _do_faq_scrape(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
-		task_log = get_task_log(task)
-		if task.operation == TaskOperation.FAQ_SCRAPE:
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting FAQ page scrape '
-				'task.',
-				extra={'task': task_log},
-			)
-			await self.faq_handler.scrape_faq_page(
-				task_log=task_log,
-				scrape_client=self.scrape_client,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-			)
-		elif task.operation == TaskOperation.FAQ_PROCESS:
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting FAQ page process '
-				'task.',
-				extra={'task': task_log},
-			)
-			self.faq_handler.process_faq_page(
-				task_log=task_log,
-				task=task,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-			)
-
-		# Raise error if operation is not recognised
-		raise ExecutorProcessFailure(
-			f'Unrecognized operation {task.operation} for '
-			f'FAQ scope.',
-			task=task,
+		_log_info(_MSG_FAQ_SCRAPE_START, task_log)
+		await self.faq_handler.scrape_faq_page(
 			task_log=task_log,
+			scrape_client=self.scrape_client,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
 		)
 
-	async def _agencies_scope(
-		self, task: SchedulerTask
+	async def _do_faq_process(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
-		task_log = get_task_log(task)
-		if (
-			task.operation
-			== TaskOperation.AGENCIES_LIST_SCRAPE
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting agencies list '
-				'scrape task.',
-				extra={'task': task_log},
-			)
-			_ = await self.agencies_handler.scrape_agencies_list_page(  # noqa: E501
-				task_log=task_log,
-				scrape_client=self.scrape_client,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-			)
-		elif (
-			task.operation
-			== TaskOperation.AGENCIES_LIST_PROCESS
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting agencies list '
-				'process task.',
-				extra={'task': task_log},
-			)
-			self.agencies_handler.process_agencies_list_data(
-				task_log=task_log,
-				task=task,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-			)
+		_log_info(_MSG_FAQ_PROCESS_START, task_log)
+		self.faq_handler.process_faq_page(
+			task_log=task_log,
+			task=task,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
+		)
 
-		# Raise error if operation is not recognised
-		raise ExecutorProcessFailure(
-			f'Unrecognized operation {task.operation} for '
-			f'FAQ scope.',
+	async def _do_agencies_list_scrape(
+		self, task: SchedulerTask, task_log: str
+	) -> TaskResult:
+		_log_info(_MSG_AGENCIES_LIST_SCRAPE_START, task_log)
+		_ = await self.agencies_handler.scrape_agencies_list_page(  # noqa: E501
+			task_log=task_log,
+			scrape_client=self.scrape_client,
+		)
+		return TaskResult.model_construct(
 			task=task,
+			success=True,
+		)
+
+	async def _do_agencies_list_process(
+		self, task: SchedulerTask, task_log: str
+	) -> TaskResult:
+		_log_info(
+			_MSG_AGENCIES_LIST_PROCESS_START, task_log
+		)
+		self.agencies_handler.process_agencies_list_data(
 			task_log=task_log,
+			task=task,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
 		)
 
-	async def _ministries_list_scope(
-		self, task: SchedulerTask
+	async def _do_ministries_list_scrape(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
-		task_log = get_task_log(task)
-		if (
-			task.operation
-			== TaskOperation.MINISTRIES_LIST_SCRAPE
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries list '
-				'scrape task.',
-				extra={'task': task_log},
-			)
-			await self.ministries_handler.scrape_ministries_list_page(  # noqa: E501
-				task_log=task_log,
-				scrape_client=self.scrape_client,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-			)
-		elif (
-			task.operation
-			== TaskOperation.MINISTRIES_LIST_PROCESS
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries list '
-				'process task.',
-				extra={'task': task_log},
-			)
-			ministry_identifiers = self.ministries_handler.process_ministries_list_data(  # noqa: E501
-				task_log=task_log,
-				task=task,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-				discovered_data=ministry_identifiers,
-			)
+		_log_info(
+			_MSG_MINISTRIES_LIST_SCRAPE_START, task_log
+		)
+		await self.ministries_handler.scrape_ministries_list_page(  # noqa: E501
+			task_log=task_log,
+			scrape_client=self.scrape_client,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
+		)
 
-		# Raise error if operation is not recognised
-		raise ExecutorProcessFailure(
-			f'Unrecognized operation {task.operation} for '
-			f'Ministries list scope.',
+	async def _do_ministries_list_process(
+		self, task: SchedulerTask, task_log: str
+	) -> TaskResult:
+		_log_info(
+			_MSG_MINISTRIES_LIST_PROCESS_START, task_log
+		)
+		ministry_identifiers = self.ministries_handler.process_ministries_list_data(  # noqa: E501
+			task_log=task_log,
+			task=task,
+		)
+		return TaskResult.model_construct(
 			task=task,
+			success=True,
+			discovered_data=ministry_identifiers,
+		)
+
+	async def _do_ministries_page_scrape(
+		self, task: SchedulerTask, task_log: str
+	) -> TaskResult:
+		_log_info(
+			_MSG_MINISTRIES_PAGE_SCRAPE_START, task_log
+		)
+		ministry_identifier = await self.ministries_handler.scrape_and_identify_ministry_page(  # noqa: E501
+			ministry_id=task.payload.ministry_id,
 			task_log=task_log,
+			task=task,
+			scrape_client=self.scrape_client,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
+			discovered_data=ministry_identifier,
 		)
 
-	async def _ministries_page_scope(
-		self, task: SchedulerTask
+	async def _do_ministries_page_process(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
-		task_log = get_task_log(task)
-		if (
-			task.operation
-			== TaskOperation.MINISTRIES_PAGE_SCRAPE
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries page '
-				'scrape task.',
-				extra={'task': task_log},
-			)
-			page_data = await self.ministries_handler.scrape_ministry_page(  # noqa: E501
-				ministry_id=task.payload.ministry_id,
-				task_log=task_log,
-				task=task,
-				scrape_client=self.scrape_client,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-				discovered_data=MinistryIdentifier(
-					ministry_id=page_data.ministry_id
-				),
-			)
-		elif (
-			task.operation
-			== TaskOperation.MINISTRIES_PAGE_PROCESS
-		):
-			"""
-			Note that the main processing for each ministry
-			page happens as the data is scraped, as we apply
-			the processing recipes to extract and structure
-			the data to inform the next steps of the
-			scheduler. This step assures that all page data
-			is processed into structured data in state
-			before we proceed to the next steps.
-			"""
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries page '
-				'process task.',
-				extra={'task': task_log},
-			)
-			# Batch processing of all ministries page data
-			# to ensure all data is processed before moving
-			# to next step in scheduler. This is because
-			# the processing step is where we extract the
-			# structured data needed to inform the next
-			# steps of the scheduler.
-			(
-				ministry_services_identifiers_list,
-				department_entry_list,
-				ministry_page_agency_data_list,
-			) = await self.ministries_handler.process_ministries_pages_data(  # noqa: E501
-				ministry_task_list=task.payload,
-				task_log=task_log,
-				task=task,
-			)
-			# Push department_entries to departments
-			# handler for processing
-			self.departments_handler.apply_department_entry_list(
+		"""
+		Note that the main processing for each ministry
+		page happens as the data is scraped, as we apply
+		the processing recipes to extract and structure
+		the data to inform the next steps of the
+		scheduler. This step assures that all page data
+		is processed into structured data in state
+		before we proceed to the next steps.
+		"""
+		_log_info(
+			_MSG_MINISTRIES_PAGE_PROCESS_START, task_log
+		)
+		# Batch processing of all ministries page data
+		# to ensure all data is processed before moving
+		# to next step in scheduler. This is because
+		# the processing step is where we extract the
+		# structured data needed to inform the next
+		# steps of the scheduler.
+		(
+			ministry_services_identifiers_list,
+			department_entry_list,
+			ministry_page_agency_data_list,
+		) = await self.ministries_handler.process_ministries_pages_data(  # noqa: E501
+			ministry_task_list=task.payload,
+			task_log=task_log,
+			task=task,
+		)
+		# Push department_entries to departments handler
+		# and ministry_page_agency_data to agencies
+		# handler, each only updates its own state
+		await asyncio.gather(
+			self._run_in_io_pool(
+				self.departments_handler.apply_department_entry_list,
 				department_entry_list=department_entry_list,
 				task_log=task_log,
 				task=task,
-			)
-			# Push ministry_page_agency_data to
-			# agencies handler for processing
-			self.agencies_handler.apply_ministry_page_agency_data_list(
+			),
+			self._run_in_io_pool(
+				self.agencies_handler.apply_ministry_page_agency_data_list,
 				ministry_page_agency_data_list=ministry_page_agency_data_list,
 				task_log=task_log,
 				task=task,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-				discovered_data=ministry_services_identifiers_list,
-			)
-		# Raise error if operation is not recognised
-		raise ExecutorProcessFailure(
-			f'Unrecognized operation {task.operation} for '
-			f'Ministries page scope.',
+			),
+		)
+		return TaskResult.model_construct(
 			task=task,
-			task_log=task_log,
+			success=True,
+			discovered_data=ministry_services_identifiers_list,
 		)
 
-	async def _services_scope(
-		self, task: SchedulerTask
+	async def _do_ministries_services_scrape(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
-		task_log = get_task_log(task)
-		if (
-			task.operation
-			== TaskOperation.MINISTRIES_SERVICES_SCRAPE
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries services '
-				'scrape task.',
-				extra={'task': task_log},
-			)
-			services_scraped_identifier = await self.ministries_handler.scrape_and_package_ministry_services_data(  # noqa: E501
-				service_task=task.payload,
-				task_log=task_log,
-				scrape_client=self.scrape_client,
-			)
+		_log_info(
+			_MSG_MINISTRIES_SERVICES_SCRAPE_START, task_log
+		)
+		services_scraped_identifier = await self.ministries_handler.scrape_and_package_ministry_services_data(  # noqa: E501
+			service_task=task.payload,
+			task_log=task_log,
+			scrape_client=self.scrape_client,
+		)
 
-			return TaskResult(
-				task=task,
-				success=True,
-				discovered_data=services_scraped_identifier,
-			)
-		elif (
-			task.operation
-			== TaskOperation.MINISTRIES_SERVICES_PROCESS
-		):
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Starting ministries services '
-				'process task.',
-				extra={'task': task_log},
-			)
-			(
-				services_processed_identifier,
-				service_entries_list,
-			) = await self.ministries_handler.process_service_task_list(  # noqa: E501
-				service_task_list=task.payload,
-				task_log=task_log,
-				task=task,
-			)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
+			discovered_data=services_scraped_identifier,
+		)
 
-			# Push processed service data to services
-			# handler for further processing and structuring
-			self.services_handler.apply_service_entry_list(
-				service_entry_list=service_entries_list,
-				task_log=task_log,
-				task=task,
-			)
-			return TaskResult(
-				task=task,
-				success=True,
-				discovered_data=services_processed_identifier,
-			)
-		# Raise error if operation is not recognised
-		raise ExecutorProcessFailure(
-			f'Unrecognized operation {task.operation} for '
-			f'Services page scope.',
+	async def _do_ministries_services_process(
+		self, task: SchedulerTask, task_log: str
+	) -> TaskResult:
+		_log_info(
+			_MSG_MINISTRIES_SERVICES_PROCESS_START, task_log
+		)
+		(
+			services_processed_identifier,
+			service_entries_list,
+		) = await self.ministries_handler.process_service_task_list(  # noqa: E501
+			service_task_list=task.payload,
+			task_log=task_log,
 			task=task,
+		)
+
+		# Push processed service data to services
+		# handler for further processing and structuring
+		self.services_handler.apply_service_entry_list(
+			service_entry_list=service_entries_list,
 			task_log=task_log,
+			task=task,
+		)
+		return TaskResult.model_construct(
+			task=task,
+			success=True,
+			discovered_data=services_processed_identifier,
 		)
 
-	async def _finalisation_scope(
-		self, task: SchedulerTask
+	async def _do_finalisation_checks(
+		self, task: SchedulerTask, task_log: str
 	) -> TaskResult:
 		"""
 		Perform finalisation operations after
 		all scraping and processing
 		"""
 		# Finalisation
-		logger.info(
-			'[EXECUTOR]\n'
-			'[TASK INFO]: Starting finalisation task.',
-			extra={'task': get_task_log(task)},
-		)
+		_log_info(_MSG_FINALISATION_START, task_log)
 
 		# Apply any count-based updates to handlers'
 		# states
-		self._apply_counts_to_handlers(
-			task_log=get_task_log(task),
+		await self._apply_counts_to_handlers(
+			task_log=task_log,
 			task=task,
 		)
 
 		# Perform handler specific finalisation steps,
 		# such as rendering insights reports and saving
 		# final data to files
-		self.faq_handler.finalise()
-		self.agencies_handler.finalise()
-		self.departments_handler.finalise()
-		self.ministries_handler.finalise()
-		self.services_handler.finalise()
-
-		logger.info(
-			'[EXECUTOR]\n'
-			'[TASK INFO]: Finalisation task completed.',
-			extra={'task': get_task_log(task)},
-		)
-		return TaskResult(
+		await asyncio.gather(
+			*(
+				self._run_in_io_pool(handler.finalise)
+				for handler in self._handlers
+			)
+		)
+
+		_log_info(_MSG_FINALISATION_DONE, task_log)
+		return TaskResult.model_construct(
 			task=task,
 			success=True,
 		)
@@ -456,40 +615,45 @@ class Executor:
 		"""
 		Handler for routing and executing
 		scheduled tasks based on their
-		operation type.
+		operation type. At most max_in_flight
+		tasks execute at once, the rest wait.
 		"""
+		async with self._semaphore:
+			return await self._execute_task(task)
+
+	async def _execute_task(
+		self,
+		task: SchedulerTask,
+	) -> TaskResult:
+		task_log = get_task_log(task)
 		try:
-			handler = self.scope_handler_mapping.get(
-				task.scope,
+			handler = self._dispatch.get(
+				(task.scope, task.operation)
 			)
 			if handler is None:
-				raise ExecutorProcessFailure(
-					f'No handler found for scope '
-					f'{task.scope}.',
-					task=task,
-					task_log=get_task_log(task),
-				)
+				_unrecognized(task, task_log)
 
-			task_result = await handler(task)
+			task_result = await handler(task, task_log)
 
-			logger.info(
-				'[EXECUTOR]\n'
-				'[TASK INFO]: Task executed successfully.',
-				extra={'task': get_task_log(task)},
-			)
+			_log_info(_MSG_TASK_SUCCESS, task_log)
 
-			# Save handler states after task
-			# execution
-			self.save_handlers_state()
+			# Save handler states, coalescing saves
+			# across completed scrape tasks only
+			await self._schedule_save(
+				immediate=task.operation
+				not in _DEBOUNCED_SAVE_OPERATIONS
+			)
 			return task_result
-		except Exception as e:
-			# Log the error and return a failed
-			# TaskResult
+		except (ExecutorProcessFailure, ScrapingError) as e:
+			# Log the error with its traceback and return
+			# a failed TaskResult, anything unexpected
+			# propagates to the caller
 			logger.error(
-				f'Error executing task: {e!r}',
-				extra={'task': get_task_log(task)},
+				_MSG_TASK_FAILURE,
+				exc_info=e,
+				extra={'task': task_log},
 			)
-			return TaskResult(
+			return TaskResult.model_construct(
 				task=task,
 				success=False,
 				error_message=str(e),
@@ -497,7 +661,7 @@ class Executor:
 
 	# --- Finalisation methods --- #
 
-	def _apply_counts_to_handlers(
+	async def _apply_counts_to_handlers(
 		self,
 		task_log: str,
 		task: SchedulerTask,
@@ -505,15 +669,39 @@ class Executor:
 		"""
 		Method to apply any count-based updates to the
 		handlers' states after all scraping and processing
-		is done.
+		is done. The aggregations only read handler state,
+		so they are computed concurrently before any of
+		the updates are applied.
 		"""
-		# Agency handler
-		service_count_by_agency = (  # noqa: E501
-			self.services_handler.get_service_count_by_agency(
-				task_log=task_log,
-				task=task,
+		services = self.services_handler
+		agencies = self.agencies_handler
+		departments = self.departments_handler
+		(
+			service_count_by_agency,
+			service_count_by_department,
+			service_count_by_ministry,
+			agency_count_by_department,
+			agency_count_by_ministry,
+			department_count_by_ministry,
+		) = await asyncio.gather(
+			*(
+				self._run_in_io_pool(
+					aggregate,
+					task_log=task_log,
+					task=task,
+				)
+				for aggregate in (
+					services.get_service_count_by_agency,
+					services.get_service_count_by_department,
+					services.get_service_count_by_ministry,
+					agencies.get_agency_count_by_department,
+					agencies.get_agency_count_by_ministry,
+					departments.get_department_count_by_ministry,
+				)
 			)
 		)
+
+		# Agency handler
 		self.agencies_handler.apply_service_count_by_agency(
 			service_count_by_agency=service_count_by_agency,
 			task_log=task_log,
@@ -521,24 +709,11 @@ class Executor:
 		)
 
 		# Department handler
-		service_count_by_department = (  # noqa: E501
-			self.services_handler.get_service_count_by_department(
-				task_log=task_log,
-				task=task,
-			)
-		)
 		self.departments_handler.apply_service_count_by_department(
 			service_count_by_department=service_count_by_department,
 			task_log=task_log,
 			task=task,
 		)
-
-		agency_count_by_department = (  # noqa: E501
-			self.agencies_handler.get_agency_count_by_department(
-				task_log=task_log,
-				task=task,
-			)
-		)
 		self.departments_handler.apply_agency_count_by_department(
 			agency_count_by_department=agency_count_by_department,
 			task_log=task_log,
@@ -546,36 +721,16 @@ class Executor:
 		)
 
 		# Ministries handler
-		service_count_by_ministry = (  # noqa: E501
-			self.services_handler.get_service_count_by_ministry(
-				task_log=task_log,
-				task=task,
-			)
-		)
 		self.ministries_handler.apply_service_count_by_ministry(
 			service_count_by_ministry=service_count_by_ministry,
 			task_log=task_log,
 			task=task,
 		)
-
-		agency_count_by_ministry = (  # noqa: E501
-			self.agencies_handler.get_agency_count_by_ministry(
-				task_log=task_log,
-				task=task,
-			)
-		)
 		self.ministries_handler.apply_agency_count_by_ministry(
 			agency_count_by_ministry=agency_count_by_ministry,
 			task_log=task_log,
 			task=task,
 		)
-
-		department_count_by_ministry = (  # noqa: E501
-			self.departments_handler.get_department_count_by_ministry(
-				task_log=task_log,
-				task=task,
-			)
-		)
 		self.ministries_handler.apply_department_count_by_ministry(
 			department_count_by_ministry=department_count_by_ministry,
 			task_log=task_log,
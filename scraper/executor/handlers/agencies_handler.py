@@ -5,6 +5,10 @@ scope of the scraping process.
 """
 
 import logging
+from collections import Counter
+from operator import attrgetter
+from pathlib import Path
+from typing import ClassVar
 
 import pandas as pd
 
@@ -29,14 +33,19 @@ from scraper.static.seed_urls import SeedUrls
 from scraper.utils.files import (
 	does_file_exist,
 	read_file,
+	read_file_async,
 	write_file,
+	write_file_async,
 )
 from scraper.utils.handlers import (
+	load_journaled_state,
 	save_df,
+	save_journaled_state,
 	state_to_df,
 	state_to_str,
 	str_to_state,
 )
+from scraper.utils.hashing import content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -47,65 +56,91 @@ class AgenciesHandler:
 	related to the agencies scope.
 	"""
 
-	def __init__(self) -> None:
-		# Handler configuration
-		self.handler_name = 'AGENCIES HANDLER'
-		self.seed_url = SeedUrls.AGENCIES_LIST_URL
-		self.file = (
-			Paths.RAW_DATA_DIR
-			/ 'agencies'
-			/ 'agencies_list.html'
-		)
-		self.state_file = (
-			Paths.TEMP_DIR / 'agencies_handler_state.json'
-		)
-		self.metadata_state_file = (
-			Paths.TEMP_DIR
-			/ 'agencies_handler_metadata_state.json'
-		)
-
-		# Processed file locations
-		self.processed_data_dir = (
-			Paths.PROCESSED_DATA_DIR / 'agencies'
-		)
-
-		self.processed_data_json = (
-			self.processed_data_dir / 'agencies.json'
-		)
-		self.processed_data_csv = (
-			self.processed_data_dir / 'agencies.csv'
-		)
-
-		# Insights file location
-		self.insights_file = (
-			Paths.INSIGHTS_DIR / 'agencies.md'
-		)
+	# Handler configuration, resolved once at import
+	handler_name: ClassVar[str] = 'AGENCIES HANDLER'
+	seed_url: ClassVar[str] = SeedUrls.AGENCIES_LIST_URL
+	file: ClassVar[Path] = (
+		Paths.RAW_DATA_DIR
+		/ 'agencies'
+		/ 'agencies_list.html'
+	)
+	state_file: ClassVar[Path] = (
+		Paths.TEMP_DIR / 'agencies_handler_state.json'
+	)
+	# Append-only journal of entries changed since
+	# the last full snapshot in state_file
+	state_journal_file: ClassVar[Path] = (
+		state_file.with_suffix('.jsonl')
+	)
+	metadata_state_file: ClassVar[Path] = (
+		Paths.TEMP_DIR
+		/ 'agencies_handler_metadata_state.json'
+	)
+	# Hash of the agencies list HTML the metadata
+	# state was processed from
+	metadata_hash_file: ClassVar[Path] = (
+		metadata_state_file.with_suffix('.hash')
+	)
+
+	# Processed file locations
+	processed_data_dir: ClassVar[Path] = (
+		Paths.PROCESSED_DATA_DIR / 'agencies'
+	)
+	processed_data_json: ClassVar[Path] = (
+		processed_data_dir / 'agencies.json'
+	)
+	processed_data_csv: ClassVar[Path] = (
+		processed_data_dir / 'agencies.csv'
+	)
+
+	# Insights file location
+	insights_file: ClassVar[Path] = (
+		Paths.INSIGHTS_DIR / 'agencies.md'
+	)
 
+	def __init__(self) -> None:
 		# Entity state
 		# Used to store metadata keyed by agency name hash
 		self.agency_entries_metadata: dict[
 			str, AgencyEntry
 		] = self._load_metadata_state()
+		self._metadata_source_hash = (
+			read_file(self.metadata_hash_file)
+			if does_file_exist(self.metadata_hash_file)
+			else ''
+		)
 		# Used to store final structured data keyed
 		# by agency ID
 		self.agency_entries: dict[str, AgencyEntry] = (
 			self._load_state()
 		)
 
+		# Persistence tracking, agency IDs changed since
+		# the last save and whether the metadata changed
+		self._dirty_agency_ids: set[str] = set()
+		self._metadata_dirty = False
+
 	def _save_handlers_state(self) -> None:
 		"""
-		Method to save the handler state to a file.
+		Method to save the handler state to a file. Only
+		entries changed since the last save are appended
+		to the journal, which is compacted into a full
+		snapshot once it outgrows half the snapshot.
 		"""
-		state_str = state_to_str(self.agency_entries)
-		write_file(
-			path=self.state_file,
-			content=state_str,
+		save_journaled_state(
+			state=self.agency_entries,
+			dirty_keys=self._dirty_agency_ids,
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
 		)
 
 	def _save_metadata_state(self) -> None:
 		"""
-		Method to save the handler metadata state to a file.
+		Method to save the handler metadata state to a
+		file, skipped when unchanged since the last save.
 		"""
+		if not self._metadata_dirty:
+			return
 		state_str = state_to_str(
 			self.agency_entries_metadata
 		)
@@ -113,6 +148,11 @@ class AgenciesHandler:
 			path=self.metadata_state_file,
 			content=state_str,
 		)
+		write_file(
+			path=self.metadata_hash_file,
+			content=self._metadata_source_hash,
+		)
+		self._metadata_dirty = False
 
 	def save_state(self) -> None:
 		"""
@@ -123,19 +163,23 @@ class AgenciesHandler:
 
 	def _load_state(self) -> dict[str, AgencyEntry]:
 		"""
-		Method to load the handler state from a file.
+		Method to load the handler state from the last
+		snapshot file, replaying any journal on top.
 		"""
 		if not does_file_exist(self.state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'State file not found at '
-				f'{self.state_file!r}, starting with '
-				f'empty state.',
+				'[%s]\n'
+				'State file not found at '
+				'%r, starting with '
+				'empty state.',
+				self.handler_name,
+				self.state_file,
 			)
-			return {}
-
-		state_str = read_file(self.state_file)
-		return str_to_state(state_str, AgencyEntry)
+		return load_journaled_state(
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
+			model_cls=AgencyEntry,
+		)
 
 	def _load_metadata_state(
 		self,
@@ -146,10 +190,12 @@ class AgenciesHandler:
 		"""
 		if not does_file_exist(self.metadata_state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'Metadata state file not found at '
-				f'{self.metadata_state_file!r}, starting '
-				f'with empty metadata state.',
+				'[%s]\n'
+				'Metadata state file not found at '
+				'%r, starting '
+				'with empty metadata state.',
+				self.handler_name,
+				self.metadata_state_file,
 			)
 			return {}
 
@@ -169,12 +215,14 @@ class AgenciesHandler:
 		# If file already exists, read and return content
 		if does_file_exist(self.file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'Agencies list file already exists at '
-				f'{self.file!r}, reading content.',
+				'[%s]\n'
+				'Agencies list file already exists at '
+				'%r, reading content.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
-			return read_file(self.file)
+			return await read_file_async(self.file)
 
 		agencies_list_html = await scrape_client.run(
 			url=self.seed_url,
@@ -183,15 +231,17 @@ class AgenciesHandler:
 		)
 
 		# Save scraped content to file
-		write_file(
+		await write_file_async(
 			path=self.file,
 			content=agencies_list_html,
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Agencies list page scraped and '
-			f'saved to {self.file!r}.',
+			'[%s]\n'
+			'Agencies list page scraped and '
+			'saved to %r.',
+			self.handler_name,
+			self.file,
 			extra={'task': task_log},
 		)
 
@@ -212,9 +262,11 @@ class AgenciesHandler:
 		"""
 		if not does_file_exist(self.file):
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Agencies list file does not exist at '
-				f'{self.file!r}, cannot process data.',
+				'[%s]\n'
+				'Agencies list file does not exist at '
+				'%r, cannot process data.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
 
@@ -228,6 +280,22 @@ class AgenciesHandler:
 
 		html_content = read_file(self.file)
 
+		# Skip parsing when the metadata state was already
+		# processed from this exact HTML
+		source_hash = content_hash(html_content)
+		if (
+			self.agency_entries_metadata
+			and source_hash == self._metadata_source_hash
+		):
+			logger.debug(
+				'[%s]\n'
+				'Agencies list page unchanged since last '
+				'processed, reusing metadata state.',
+				self.handler_name,
+				extra={'task': task_log},
+			)
+			return
+
 		# Process HTML content into structured data
 		agency_entries = agencies_list_processing_recipe(
 			html=html_content,
@@ -236,13 +304,16 @@ class AgenciesHandler:
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
+			'[%s]\n'
 			'Agencies list page processed into structured '
 			'AgencyEntry data.',
+			self.handler_name,
 			extra={'task': task_log},
 		)
 
 		self.agency_entries_metadata = agency_entries
+		self._metadata_source_hash = source_hash
+		self._metadata_dirty = True
 
 	# --- State update methods --- #
 
@@ -259,51 +330,57 @@ class AgenciesHandler:
 		using a list of MinistryPageAgencyData observed on
 		a ministry page.
 		"""
+		# Bind lookups once, the loop below is pure Python
+		get_metadata = self.agency_entries_metadata.get
+		agency_entries = self.agency_entries
+		dirty_agency_ids = self._dirty_agency_ids
 		for agency_entry in ministry_page_agency_data_list:
-			# Destructure agency entry metadata
-			agency_metadata = (
-				self.agency_entries_metadata.get(
-					agency_entry.agency_name_hash,
-				)
-			)
-			m_agency_url = (
-				agency_metadata.agency_url
-				if agency_metadata
-				else ''
-			)
-			m_logo_url = (
-				agency_metadata.logo_url
-				if agency_metadata
-				else ''
+			agency_metadata = get_metadata(
+				agency_entry.agency_name_hash
 			)
-			m_agency_description = (
-				agency_metadata.agency_description
-				if agency_metadata
-				else ''
-			)
-			self.agency_entries[agency_entry.agency_id] = (
-				AgencyEntry(
+			if agency_metadata is not None:
+				# Metadata entry already carries the
+				# description, logo and URL, copy it with
+				# the page fields instead of revalidating
+				entry = agency_metadata.model_copy(
+					update={
+						'agency_id': agency_entry.agency_id,
+						'agency_name_hash': agency_entry.agency_name_hash,  # noqa: E501
+						'ministry_id': agency_entry.ministry_id,  # noqa: E501
+						'department_id': agency_entry.department_id,  # noqa: E501
+						'agency_name': agency_entry.agency_name,  # noqa: E501
+						'observed_service_count': None,
+						'ministry_departments_agencies_url': (  # noqa: E501
+							agency_entry.ministry_departments_agencies_url
+						),
+					}
+				)
+			else:
+				entry = AgencyEntry(
 					agency_id=agency_entry.agency_id,
 					agency_name_hash=agency_entry.agency_name_hash,
 					ministry_id=agency_entry.ministry_id,
 					department_id=agency_entry.department_id,
 					agency_name=agency_entry.agency_name,
-					agency_description=m_agency_description,
-					logo_url=m_logo_url,
-					agency_url=m_agency_url,
+					agency_description='',
+					logo_url='',
+					agency_url='',
 					observed_service_count=None,
 					ministry_departments_agencies_url=(  # noqa: E501
 						agency_entry.ministry_departments_agencies_url
 					),
 				)
-			)
+			agency_entries[agency_entry.agency_id] = entry
+			dirty_agency_ids.add(agency_entry.agency_id)
 
 		count = len(ministry_page_agency_data_list)
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to agencies '
-			f'state with {count} '
-			f'agency entries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to agencies '
+			'state with %s '
+			'agency entries.',
+			self.handler_name,
+			count,
 			extra={'task': task_log},
 		)
 
@@ -326,12 +403,15 @@ class AgenciesHandler:
 				entry = self.agency_entries[agency_id]
 				entry.observed_service_count = service_count
 				self.agency_entries[agency_id] = entry
+				self._dirty_agency_ids.add(agency_id)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to agencies '
-			f'state with service count by agency data for '
-			f'{len(service_count_by_agency)} agencies.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to agencies '
+			'state with service count by agency data for '
+			'%s agencies.',
+			self.handler_name,
+			len(service_count_by_agency),
 			extra={'task': task_log},
 		)
 
@@ -347,19 +427,22 @@ class AgenciesHandler:
 		Returns a dictionary mapping ministry IDs to
 		the count of agencies they oversee.
 		"""
-		agency_count_by_ministry: dict[str, int] = {}
-
-		for agency_entry in self.agency_entries.values():
-			ministry_id = agency_entry.ministry_id
-			if ministry_id not in agency_count_by_ministry:
-				agency_count_by_ministry[ministry_id] = 0
-			agency_count_by_ministry[ministry_id] += 1
+		agency_count_by_ministry = dict(
+			Counter(
+				map(
+					attrgetter('ministry_id'),
+					self.agency_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed agency count by '
-			f'ministry for {len(agency_count_by_ministry)} '
-			f'ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Computed agency count by '
+			'ministry for %s '
+			'ministries.',
+			self.handler_name,
+			len(agency_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -375,25 +458,23 @@ class AgenciesHandler:
 		Returns a dictionary mapping department IDs to
 		the count of agencies they oversee.
 		"""
-		agency_count_by_department: dict[str, int] = {}
-
-		for agency_entry in self.agency_entries.values():
-			department_id = agency_entry.department_id
-			if (
-				department_id
-				not in agency_count_by_department
-			):
-				agency_count_by_department[
-					department_id
-				] = 0
-			agency_count_by_department[department_id] += 1
+		agency_count_by_department = dict(
+			Counter(
+				map(
+					attrgetter('department_id'),
+					self.agency_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed agency count by '
-			f'department for  '
-			f'{len(agency_count_by_department)} '
-			f'departments.',
+			'[%s]\n'
+			'[TASK INFO]: Computed agency count by '
+			'department for  '
+			'%s '
+			'departments.',
+			self.handler_name,
+			len(agency_count_by_department),
 			extra={'task': task_log},
 		)
 
@@ -443,8 +524,11 @@ class AgenciesHandler:
 		self.agencies_insights(agency_df)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Agencies handler finalised. Processed data '
-			f'saved to {self.processed_data_dir!r} and '
-			f'insights saved to {self.insights_file!r}.',
+			'[%s]\n'
+			'Agencies handler finalised. Processed data '
+			'saved to %r and '
+			'insights saved to %r.',
+			self.handler_name,
+			self.processed_data_dir,
+			self.insights_file,
 		)
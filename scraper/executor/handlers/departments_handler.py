@@ -8,6 +8,10 @@ from the ministries pages related to the departments.)
 """
 
 import logging
+from collections import Counter
+from operator import attrgetter
+from pathlib import Path
+from typing import ClassVar
 
 from scraper.insights.core import render_insights_report
 from scraper.schemas.departments import DepartmentEntry
@@ -15,14 +19,13 @@ from scraper.schemas.scheduler_task import SchedulerTask
 from scraper.static.paths import Paths
 from scraper.utils.files import (
 	does_file_exist,
-	read_file,
 	write_file,
 )
 from scraper.utils.handlers import (
+	load_journaled_state,
 	save_df,
+	save_journaled_state,
 	state_to_df,
-	state_to_str,
-	str_to_state,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,61 +37,73 @@ class DepartmentsHandler:
 	related to the departments scope.
 	"""
 
-	def __init__(self) -> None:
-		# Handler configuration
-		self.handler_name = 'DEPARTMENTS HANDLER'
-		self.state_file = (
-			Paths.TEMP_DIR
-			/ 'departments_handler_state.json'
-		)
-
-		# Processed file locations
-		self.processed_data_dir = (
-			Paths.PROCESSED_DATA_DIR / 'departments'
-		)
-
-		self.processed_data_json = (
-			self.processed_data_dir / 'departments.json'
-		)
-		self.processed_data_csv = (
-			self.processed_data_dir / 'departments.csv'
-		)
-
-		# Insights file location
-		self.insights_file = (
-			Paths.INSIGHTS_DIR / 'departments.md'
-		)
+	# Handler configuration, resolved once at import
+	handler_name: ClassVar[str] = 'DEPARTMENTS HANDLER'
+	state_file: ClassVar[Path] = (
+		Paths.TEMP_DIR / 'departments_handler_state.json'
+	)
+	# Append-only journal of entries changed since
+	# the last full snapshot in state_file
+	state_journal_file: ClassVar[Path] = (
+		state_file.with_suffix('.jsonl')
+	)
+
+	# Processed file locations
+	processed_data_dir: ClassVar[Path] = (
+		Paths.PROCESSED_DATA_DIR / 'departments'
+	)
+	processed_data_json: ClassVar[Path] = (
+		processed_data_dir / 'departments.json'
+	)
+	processed_data_csv: ClassVar[Path] = (
+		processed_data_dir / 'departments.csv'
+	)
+
+	# Insights file location
+	insights_file: ClassVar[Path] = (
+		Paths.INSIGHTS_DIR / 'departments.md'
+	)
 
+	def __init__(self) -> None:
 		# Entity state
 		self.department_entries: dict[
 			str, DepartmentEntry
 		] = self._load_state()
 
+		# Department IDs changed since the last save
+		self._dirty_department_ids: set[str] = set()
+
 	def save_state(self) -> None:
 		"""
-		Method to save the handler state to a file.
+		Method to save the entries changed since the last
+		save, journaled on top of the state snapshot.
 		"""
-		state_str = state_to_str(self.department_entries)
-		write_file(
-			path=self.state_file,
-			content=state_str,
+		save_journaled_state(
+			state=self.department_entries,
+			dirty_keys=self._dirty_department_ids,
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
 		)
 
 	def _load_state(self) -> dict[str, DepartmentEntry]:
 		"""
-		Method to load the handler state from a file.
+		Method to load the handler state from the last
+		snapshot file, replaying any journal on top.
 		"""
 		if not does_file_exist(self.state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'State file not found at '
-				f'{self.state_file!r}, starting with empty '
-				f'state.',
+				'[%s]\n'
+				'State file not found at '
+				'%r, starting with empty '
+				'state.',
+				self.handler_name,
+				self.state_file,
 			)
-			return {}
-
-		state_str = read_file(self.state_file)
-		return str_to_state(state_str, DepartmentEntry)
+		return load_journaled_state(
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
+			model_cls=DepartmentEntry,
+		)
 
 	# --- Processing methods --- #
 
@@ -108,12 +123,17 @@ class DepartmentsHandler:
 			self.department_entries[
 				department_entry.department_id
 			] = department_entry
+			self._dirty_department_ids.add(
+				department_entry.department_id
+			)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to departments '
-			f'state with {len(department_entry_list)} '
-			f'department entries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to departments '
+			'state with %s '
+			'department entries.',
+			self.handler_name,
+			len(department_entry_list),
 			extra={'task': task_log},
 		)
 
@@ -141,13 +161,18 @@ class DepartmentsHandler:
 				self.department_entries[department_id] = (
 					department_entry
 				)
+				self._dirty_department_ids.add(
+					department_id
+				)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to departments '
-			f'state with agency count for '
-			f'{len(agency_count_by_department)} '
-			f'departments.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to departments '
+			'state with agency count for '
+			'%s '
+			'departments.',
+			self.handler_name,
+			len(agency_count_by_department),
 			extra={'task': task_log},
 		)
 
@@ -175,13 +200,18 @@ class DepartmentsHandler:
 				self.department_entries[department_id] = (
 					department_entry
 				)
+				self._dirty_department_ids.add(
+					department_id
+				)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to departments '
-			f'state with service count for '
-			f'{len(service_count_by_department)} '
-			f'departments.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to departments '
+			'state with service count for '
+			'%s '
+			'departments.',
+			self.handler_name,
+			len(service_count_by_department),
 			extra={'task': task_log},
 		)
 
@@ -197,27 +227,23 @@ class DepartmentsHandler:
 		Returns a dictionary mapping ministry IDs to the
 		count of departments under them.
 		"""
-		department_count_by_ministry: dict[str, int] = {}
-
-		for (
-			department_entry
-		) in self.department_entries.values():
-			ministry_id = department_entry.ministry_id
-			if (
-				ministry_id
-				not in department_count_by_ministry
-			):
-				department_count_by_ministry[
-					ministry_id
-				] = 0
-			department_count_by_ministry[ministry_id] += 1
+		department_count_by_ministry = dict(
+			Counter(
+				map(
+					attrgetter('ministry_id'),
+					self.department_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed department count by '
-			f'ministry for  '
-			f'{len(department_count_by_ministry)} '
-			f'ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Computed department count by '
+			'ministry for  '
+			'%s '
+			'ministries.',
+			self.handler_name,
+			len(department_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -265,9 +291,12 @@ class DepartmentsHandler:
 		self.departments_insights(department_df)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Departments handler finalised. Processed '
-			f'data saved to {self.processed_data_dir!r} '
-			f'and insights saved to '
-			f'{self.insights_file!r}.',
+			'[%s]\n'
+			'Departments handler finalised. Processed '
+			'data saved to %r '
+			'and insights saved to '
+			'%r.',
+			self.handler_name,
+			self.processed_data_dir,
+			self.insights_file,
 		)
@@ -26,7 +26,9 @@ from scraper.static.seed_urls import SeedUrls
 from scraper.utils.files import (
 	does_file_exist,
 	read_file,
+	read_file_async,
 	write_file,
+	write_file_async,
 )
 from scraper.utils.handlers import (
 	save_df,
@@ -34,6 +36,7 @@ from scraper.utils.handlers import (
 	state_to_str,
 	str_to_state,
 )
+from scraper.utils.hashing import content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,11 @@ class FAQHandler:
 		self.state_file = (
 			Paths.TEMP_DIR / 'faq_handler_state.json'
 		)
+		# Hash of the FAQ HTML the state was
+		# processed from
+		self.state_hash_file = self.state_file.with_suffix(
+			'.hash'
+		)
 
 		# Processed file locations
 		self.processed_data_dir = (
@@ -72,6 +80,11 @@ class FAQHandler:
 		self.faq_entities: dict[str, FAQEntry] = (
 			self._load_state()
 		)
+		self._source_hash = (
+			read_file(self.state_hash_file)
+			if does_file_exist(self.state_hash_file)
+			else ''
+		)
 
 	def save_state(self) -> None:
 		"""
@@ -82,6 +95,10 @@ class FAQHandler:
 			path=self.state_file,
 			content=state_str,
 		)
+		write_file(
+			path=self.state_hash_file,
+			content=self._source_hash,
+		)
 
 	def _load_state(self) -> dict[str, FAQEntry]:
 		"""
@@ -89,10 +106,12 @@ class FAQHandler:
 		"""
 		if not does_file_exist(self.state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'FAQ handler state file not found at '
-				f'{self.state_file!r}, starting with '
-				f'empty state.',
+				'[%s]\n'
+				'FAQ handler state file not found at '
+				'%r, starting with '
+				'empty state.',
+				self.handler_name,
+				self.state_file,
 			)
 			return {}
 
@@ -112,12 +131,14 @@ class FAQHandler:
 		# If file already exists, read and return content
 		if does_file_exist(self.file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'FAQ file already exists at '
-				f'{self.file!r}, reading content.',
+				'[%s]\n'
+				'FAQ file already exists at '
+				'%r, reading content.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
-			return read_file(self.file)
+			return await read_file_async(self.file)
 
 		faq_html = await scrape_client.run(
 			url=self.seed_url,
@@ -126,14 +147,15 @@ class FAQHandler:
 		)
 
 		# Save scraped content to file
-		write_file(
+		await write_file_async(
 			path=self.file,
 			content=faq_html,
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'FAQ page scraped and saved to {self.file!r}.',
+			'[%s]\nFAQ page scraped and saved to %r.',
+			self.handler_name,
+			self.file,
 			extra={'task': task_log},
 		)
 
@@ -151,9 +173,11 @@ class FAQHandler:
 		"""
 		if not does_file_exist(self.file):
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'FAQ file not found at {self.file!r} '
+				'[%s]\n'
+				'FAQ file not found at %r '
 				'for processing.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -165,16 +189,33 @@ class FAQHandler:
 
 		faq_html = read_file(self.file)
 
+		# Skip parsing when the state was already
+		# processed from this exact HTML
+		source_hash = content_hash(faq_html)
+		if (
+			self.faq_entities
+			and source_hash == self._source_hash
+		):
+			logger.debug(
+				'[%s]\n'
+				'FAQ page unchanged since last processed, '
+				'reusing state.',
+				self.handler_name,
+				extra={'task': task_log},
+			)
+			return
+
 		self.faq_entities = faq_page_processing_recipe(
 			html=faq_html,
 			task_log=task_log,
 			task=task,
 		)
+		self._source_hash = source_hash
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'FAQ page processed into'
-			f' {len(self.faq_entities)} entries.',
+			'[%s]\nFAQ page processed into %s entries.',
+			self.handler_name,
+			len(self.faq_entities),
 			extra={'task': task_log},
 		)
 
@@ -219,8 +260,11 @@ class FAQHandler:
 		self.faqs_insights(faq_df)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'FAQ handler finalised. Processed data saved '
-			f'to {self.processed_data_dir!r} and insights '
-			f'saved to {self.insights_file!r}.',
+			'[%s]\n'
+			'FAQ handler finalised. Processed data saved '
+			'to %r and insights '
+			'saved to %r.',
+			self.handler_name,
+			self.processed_data_dir,
+			self.insights_file,
 		)
@@ -6,6 +6,11 @@ scope of the scraping process.
 
 import asyncio
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 import pandas as pd
@@ -15,8 +20,7 @@ from scraper.exceptions.executor import (
 )
 from scraper.insights.core import render_insights_report
 from scraper.processing.recipes.ministries import (
-	ministry_departments_agencies_processing_recipe,
-	ministry_overview_processing_recipe,
+	ministry_page_processing_recipe,
 	ministry_service_processing_recipe,
 )
 from scraper.processing.recipes.ministries_list import (
@@ -35,6 +39,7 @@ from scraper.schemas.ministries import (
 	MinistryPageProcessingResult,
 )
 from scraper.schemas.scheduler_task import (
+	MinistryIdentifier,
 	MinistryIdentifiers,
 	MinistryServicesIdentifier,
 	MinistryServicesIdentifiersList,
@@ -55,9 +60,13 @@ from scraper.scraping.scrape_client import ScrapeClient
 from scraper.static.paths import Paths
 from scraper.static.seed_urls import SeedUrls
 from scraper.utils.files import (
+	do_files_exist_async,
 	does_file_exist,
 	read_file,
+	read_files_async,
 	write_file,
+	write_file_async,
+	write_files_async,
 )
 from scraper.utils.handlers import (
 	save_df,
@@ -65,9 +74,13 @@ from scraper.utils.handlers import (
 	state_to_str,
 	str_to_state,
 )
+from scraper.utils.hashing import content_hash
 
 logger = logging.getLogger(__name__)
 
+# Root of the raw ministries data, resolved once
+_MINISTRIES_RAW_DIR = Paths.RAW_DATA_DIR / 'ministries'
+
 
 class MinistriesHandler:
 	"""
@@ -87,6 +100,11 @@ class MinistriesHandler:
 		self.state_file = (
 			Paths.TEMP_DIR / 'ministries_handler_state.json'
 		)
+		# Hash of the ministries list HTML the state
+		# was processed from
+		self.state_hash_file = self.state_file.with_suffix(
+			'.hash'
+		)
 
 		# Processed file locations
 		self.processed_data_dir = (
@@ -109,6 +127,29 @@ class MinistriesHandler:
 		self.ministry_entries: dict[str, MinistryEntry] = (
 			self._load_state()
 		)
+		self._source_hash = (
+			read_file(self.state_hash_file)
+			if does_file_exist(self.state_hash_file)
+			else ''
+		)
+
+		# Worker processes for the CPU bound HTML
+		# parsing. Spawned rather than forked so workers
+		# do not inherit the browser's threads, and
+		# capped as each one is a fresh interpreter
+		self._cpu_pool = ProcessPoolExecutor(
+			max_workers=min(4, os.cpu_count() or 1),
+			mp_context=multiprocessing.get_context('spawn'),
+		)
+
+	def close(self) -> None:
+		"""
+		Method to shut down the handler's worker
+		processes.
+		"""
+		self._cpu_pool.shutdown(
+			wait=False, cancel_futures=True
+		)
 
 	def save_state(self) -> None:
 		"""
@@ -119,6 +160,10 @@ class MinistriesHandler:
 			path=self.state_file,
 			content=state_str,
 		)
+		write_file(
+			path=self.state_hash_file,
+			content=self._source_hash,
+		)
 
 	def _load_state(self) -> dict[str, MinistryEntry]:
 		"""
@@ -126,10 +171,12 @@ class MinistriesHandler:
 		"""
 		if not does_file_exist(self.state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'State file not found at, '
-				f'{self.state_file!r} starting with '
+				'[%s]\n'
+				'State file not found at, '
+				'%r starting with '
 				'empty state.',
+				self.handler_name,
+				self.state_file,
 			)
 			return {}
 
@@ -137,42 +184,39 @@ class MinistriesHandler:
 		return str_to_state(state_str, MinistryEntry)
 
 	# File builder methods for constructing file paths for
-	# ministries data based on ministry identifiers
+	# ministries data based on ministry identifiers. The
+	# same paths are built at the scrape and processing
+	# steps, so they are cached
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def _build_ministry_overview_file_path(
 		ministry_id: str,
 	) -> Path:
-		return (
-			Paths.RAW_DATA_DIR
-			/ 'ministries'
-			/ ministry_id
-			/ 'overview.html'
+		return _MINISTRIES_RAW_DIR.joinpath(
+			ministry_id, 'overview.html'
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def _build_ministry_departments_agencies_file_path(
 		ministry_id: str,
 	) -> Path:
-		return (
-			Paths.RAW_DATA_DIR
-			/ 'ministries'
-			/ ministry_id
-			/ 'departments_agencies.html'
+		return _MINISTRIES_RAW_DIR.joinpath(
+			ministry_id, 'departments_agencies.html'
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=4096)
 	def _build_ministry_services_file_path(
 		ministry_id: str,
 		department_id: str,
 		agency_id: str,
 	) -> Path:
-		return (
-			Paths.RAW_DATA_DIR
-			/ 'ministries'
-			/ ministry_id
-			/ department_id
-			/ agency_id
-			/ 'services.html'
+		return _MINISTRIES_RAW_DIR.joinpath(
+			ministry_id,
+			department_id,
+			agency_id,
+			'services.html',
 		)
 
 	# --- Scraping methods ---
@@ -185,15 +229,20 @@ class MinistriesHandler:
 		"""
 		Method to scrape the ministries list page content.
 		"""
-		# If file already exists, read and return content
-		if does_file_exist(self.file):
+		# If file already exists, return its content
+		(ministries_list_html,) = await read_files_async(
+			[self.file]
+		)
+		if ministries_list_html is not None:
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'Ministries list file already exists at '
-				f'{self.file!r}, reading content.',
+				'[%s]\n'
+				'Ministries list file already exists at '
+				'%r, reusing content.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
-			return read_file(self.file)
+			return ministries_list_html
 
 		ministries_list_html = await scrape_client.run(
 			url=self.seed_url,
@@ -201,14 +250,16 @@ class MinistriesHandler:
 			recipe=ministries_list_page_recipe,
 		)
 		# Save scraped content to file
-		write_file(
+		await write_file_async(
 			path=self.file,
 			content=ministries_list_html,
 		)
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministries list page scraped and '
-			f'saved to {self.file!r}.',
+			'[%s]\n'
+			'Ministries list page scraped and '
+			'saved to %r.',
+			self.handler_name,
+			self.file,
 			extra={'task': task_log},
 		)
 		return ministries_list_html
@@ -235,27 +286,33 @@ class MinistriesHandler:
 				ministry_id
 			)
 		)
-		# If both files already exist,
-		# read and return content
-		if does_file_exist(
-			ministry_overview_file
-		) and does_file_exist(
-			ministry_departments_agencies_file
+		# If both files already exist, return their
+		# content, read together in one batch
+		(
+			overview_html,
+			departments_agencies_html,
+		) = await read_files_async(
+			[
+				ministry_overview_file,
+				ministry_departments_agencies_file,
+			]
+		)
+		if (
+			overview_html is not None
+			and departments_agencies_html is not None
 		):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'Ministry page files already exist for '
-				f'{ministry_id} at {ministry_overview_file!r} '  # noqa: E501
-				f'and {ministry_departments_agencies_file!r}, '  # noqa: E501
-				f'reading content.',
+				'[%s]\n'
+				'Ministry page files already exist for '
+				'%s at %r '
+				'and %r, '
+				'reusing content.',
+				self.handler_name,
+				ministry_id,
+				ministry_overview_file,
+				ministry_departments_agencies_file,
 				extra={'task': task_log},
 			)
-			overview_html = read_file(
-				ministry_overview_file
-			)
-			departments_agencies_html = read_file(
-				ministry_departments_agencies_file
-			)
 			return MinistryPageData(
 				ministry_id=ministry_id,
 				overview=overview_html,
@@ -263,15 +320,18 @@ class MinistriesHandler:
 			)
 
 		# Retrieve ministry URL from handler state
-		ministry_entry = self.ministry_entries.get(
-			ministry_id
-		)
-		if not ministry_entry:
+		try:
+			ministry_entry = self.ministry_entries[
+				ministry_id
+			]
+		except KeyError:
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Ministry entry not found in handler '
-				f'state for ministry_id {ministry_id} '
-				f' when scraping ministry page.',
+				'[%s]\n'
+				'Ministry entry not found in handler '
+				'state for ministry_id %s '
+				' when scraping ministry page.',
+				self.handler_name,
+				ministry_id,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -281,7 +341,7 @@ class MinistriesHandler:
 				f'ministry page.',
 				task_log=task_log,
 				task=task,
-			)
+			) from None
 		ministry_url = ministry_entry.ministry_url
 
 		ministry_page_data = await scrape_client.run(
@@ -291,24 +351,64 @@ class MinistriesHandler:
 		)
 		ministry_page_data.ministry_id = ministry_id
 
-		# Save scraped content to files
-		write_file(
-			path=ministry_overview_file,
-			content=ministry_page_data.overview,
-		)
-		write_file(
-			path=ministry_departments_agencies_file,
-			content=ministry_page_data.departments_and_agencies,
+		# Save scraped content to files in one batch
+		await write_files_async(
+			[
+				(
+					ministry_overview_file,
+					ministry_page_data.overview,
+				),
+				(
+					ministry_departments_agencies_file,
+					ministry_page_data.departments_and_agencies,
+				),
+			]
 		)
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministry page scraped for {ministry_id} and '
-			f'saved to {ministry_overview_file!r} and '
-			f'{ministry_departments_agencies_file!r}.',
+			'[%s]\n'
+			'Ministry page scraped for %s and '
+			'saved to %r and '
+			'%r.',
+			self.handler_name,
+			ministry_id,
+			ministry_overview_file,
+			ministry_departments_agencies_file,
 			extra={'task': task_log},
 		)
 		return ministry_page_data
 
+	async def scrape_and_identify_ministry_page(
+		self,
+		ministry_id: str,
+		task_log: str,
+		task: SchedulerTask,
+		scrape_client: ScrapeClient,
+	) -> MinistryIdentifier:
+		"""
+		Method to ensure an individual ministry page is
+		scraped to file, returning the identifier to pass
+		back to the scheduler. Already scraped pages are
+		not read back, as the content is only needed at
+		the processing step.
+		"""
+		if not await do_files_exist_async(
+			[
+				self._build_ministry_overview_file_path(
+					ministry_id
+				),
+				self._build_ministry_departments_agencies_file_path(  # noqa: E501
+					ministry_id
+				),
+			]
+		):
+			await self.scrape_ministry_page(
+				ministry_id=ministry_id,
+				task_log=task_log,
+				task=task,
+				scrape_client=scrape_client,
+			)
+		return MinistryIdentifier(ministry_id=ministry_id)
+
 	async def scrape_ministry_services_page(
 		self,
 		ministry_id: str,
@@ -331,18 +431,25 @@ class MinistriesHandler:
 			)
 		)
 
-		# If file already exists,
-		# read and return content
-		if does_file_exist(services_file):
+		# If file already exists, return its content
+		(services_html,) = await read_files_async(
+			[services_file]
+		)
+		if services_html is not None:
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'Ministry services file already exists '
-				f'for {ministry_id} under department '
-				f'{department_id} and agency {agency_id} '
-				f'at {services_file!r}, reading content.',
+				'[%s]\n'
+				'Ministry services file already exists '
+				'for %s under department '
+				'%s and agency %s '
+				'at %r, reusing content.',
+				self.handler_name,
+				ministry_id,
+				department_id,
+				agency_id,
+				services_file,
 				extra={'task': task_log},
 			)
-			return read_file(services_file)
+			return services_html
 
 		services_html = await scrape_client.run(
 			url=ministry_departments_agencies_url,
@@ -350,16 +457,21 @@ class MinistriesHandler:
 			recipe=ministry_services_page_recipe,
 		)
 
-		write_file(
+		await write_file_async(
 			path=services_file,
 			content=services_html,
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministry services page scraped for '
-			f'{ministry_id} under department {department_id} '  # noqa: E501
-			f'and agency {agency_id}, saved to {services_file!r}.',  # noqa: E501
+			'[%s]\n'
+			'Ministry services page scraped for '
+			'%s under department %s '
+			'and agency %s, saved to %r.',
+			self.handler_name,
+			ministry_id,
+			department_id,
+			agency_id,
+			services_file,
 			extra={'task': task_log},
 		)
 		return services_html
@@ -408,9 +520,11 @@ class MinistriesHandler:
 		"""
 		if not does_file_exist(self.file):
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Ministries list file does not exist at '
-				f'{self.file!r}, cannot process data.',
+				'[%s]\n'
+				'Ministries list file does not exist at '
+				'%r, cannot process data.',
+				self.handler_name,
+				self.file,
 				extra={'task': task_log},
 			)
 
@@ -424,6 +538,24 @@ class MinistriesHandler:
 
 		html_content = read_file(self.file)
 
+		# Skip parsing when the state was already
+		# processed from this exact HTML
+		source_hash = content_hash(html_content)
+		if (
+			self.ministry_entries
+			and source_hash == self._source_hash
+		):
+			logger.debug(
+				'[%s]\n'
+				'Ministries list page unchanged since last '
+				'processed, reusing state.',
+				self.handler_name,
+				extra={'task': task_log},
+			)
+			return MinistryIdentifiers(
+				ministry_ids=list(self.ministry_entries),
+			)
+
 		ministry_entries = (
 			ministries_list_processing_recipe(
 				html=html_content,
@@ -433,13 +565,16 @@ class MinistriesHandler:
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministries list data processed for '
-			f'{len(ministry_entries)} ministries.',
+			'[%s]\n'
+			'Ministries list data processed for '
+			'%s ministries.',
+			self.handler_name,
+			len(ministry_entries),
 			extra={'task': task_log},
 		)
 
 		self.ministry_entries = ministry_entries
+		self._source_hash = source_hash
 		return MinistryIdentifiers(
 			ministry_ids=list(ministry_entries.keys()),
 		)
@@ -447,6 +582,8 @@ class MinistriesHandler:
 	async def _process_ministry_page_data(
 		self,
 		ministry_id: str,
+		overview_html: str | None,
+		departments_agencies_html: str | None,
 		task_log: str,
 		task: SchedulerTask,
 	) -> tuple[
@@ -455,8 +592,9 @@ class MinistriesHandler:
 	]:
 		"""
 		Method to process the raw HTML content of a
-		ministry page into structured data and update
-		handler state with observed data.
+		ministry page, read in batch by the caller with
+		None for a missing file, into structured data
+		and update handler state with observed data.
 		"""
 
 		# Check if scraped ministry page data exists in
@@ -474,17 +612,20 @@ class MinistriesHandler:
 			)
 		)
 
-		if not does_file_exist(
-			ministry_overview_file
-		) or not does_file_exist(
-			ministry_departments_agencies_file
+		if (
+			overview_html is None
+			or departments_agencies_html is None
 		):
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Ministry page files do not exist for '
-				f'{ministry_id} at {ministry_overview_file!r} '  # noqa: E501
-				f'and {ministry_departments_agencies_file!r}, '  # noqa: E501
-				f'cannot process data.',
+				'[%s]\n'
+				'Ministry page files do not exist for '
+				'%s at %r '
+				'and %r, '
+				'cannot process data.',
+				self.handler_name,
+				ministry_id,
+				ministry_overview_file,
+				ministry_departments_agencies_file,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -502,27 +643,20 @@ class MinistriesHandler:
 			ministry_id
 		].ministry_url
 
-		# Overview data
-		overview_html = read_file(ministry_overview_file)
-		ministry_overview_processed_data = (
-			ministry_overview_processing_recipe(
-				html=overview_html, ministry_id=ministry_id
-			)
-		)
-
-		# Departments and agencies data
-		departments_agencies_html = read_file(
-			ministry_departments_agencies_file
-		)
-		ministry_departments_agencies_processed_data = (  # noqa: E501
-			ministry_departments_agencies_processing_recipe(
-				html=departments_agencies_html,
-				ministry_id=ministry_id,
-				ministry_url=ministry_url,
-			)
-		)
-		department_entries, ministry_page_agency_data = (
-			ministry_departments_agencies_processed_data
+		# Overview, departments and agencies data are
+		# parsed in a worker process so ministry pages
+		# gathered by the caller parse in parallel
+		loop = asyncio.get_running_loop()
+		(
+			ministry_overview_processed_data,
+			(department_entries, ministry_page_agency_data),
+		) = await loop.run_in_executor(
+			self._cpu_pool,
+			ministry_page_processing_recipe,
+			ministry_id,
+			ministry_url,
+			overview_html,
+			departments_agencies_html,
 		)
 
 		# Package data into response type for
@@ -536,9 +670,11 @@ class MinistriesHandler:
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministry page data processed for ministry '
-			f'{ministry_id}.',
+			'[%s]\n'
+			'Ministry page data processed for ministry '
+			'%s.',
+			self.handler_name,
+			ministry_id,
 			extra={'task': task_log},
 		)
 		ministry_page_processing_result = MinistryPageProcessingResult(  # noqa: E501
@@ -574,17 +710,43 @@ class MinistriesHandler:
 			for ministry_task in ministry_task_list.ministry_ids  # noqa: E501
 		]
 
+		# Read every ministry's page files in one batch,
+		# overview and departments/agencies interleaved
+		pages_html = await read_files_async(
+			path
+			for ministry_id in ministry_tasks
+			for path in (
+				self._build_ministry_overview_file_path(
+					ministry_id
+				),
+				self._build_ministry_departments_agencies_file_path(  # noqa: E501
+					ministry_id
+				),
+			)
+		)
+
 		# Process each ministry page data in parallel and
 		# gather results.
 		tasks = [
 			asyncio.create_task(
 				self._process_ministry_page_data(
 					ministry_id=ministry_id,
+					overview_html=overview_html,
+					departments_agencies_html=departments_agencies_html,  # noqa: E501
 					task_log=task_log,
 					task=task,
 				)
 			)
-			for ministry_id in ministry_tasks
+			for (
+				ministry_id,
+				overview_html,
+				departments_agencies_html,
+			) in zip(
+				ministry_tasks,
+				pages_html[0::2],
+				pages_html[1::2],
+				strict=True,
+			)
 		]
 
 		results_pure: list[
@@ -596,22 +758,27 @@ class MinistriesHandler:
 		] = await asyncio.gather(
 			*tasks, return_exceptions=True
 		)
-		results: list[
-			tuple[
-				MinistryPageProcessingResult,
-				MinistryPageOverviewData,
-			]
-		] = []
-
 		# Raise error if any of the tasks resulted in an
-		# exception, use this to filter out successful
-		# results from failed ones
+		# exception, otherwise split the overview data
+		# from the flattened data for return in one pass
+		ministry_page_overview_data_list: list[
+			MinistryPageOverviewData
+		] = []
+		ministry_services_identifiers: list[
+			MinistryServicesIdentifier
+		] = []
+		department_entries: list[DepartmentEntry] = []
+		ministry_page_agency_data: list[
+			MinistryPageAgencyData
+		] = []
 		for result in results_pure:
 			if isinstance(result, BaseException):
 				logger.error(
-					f'[{self.handler_name}]\n'
-					f'Error processing ministry page data: '
-					f'{result!r}',
+					'[%s]\n'
+					'Error processing ministry page data: '
+					'%r',
+					self.handler_name,
+					result,
 					extra={'task': task_log},
 				)
 				raise ExecutorProcessingFailure(
@@ -620,47 +787,28 @@ class MinistriesHandler:
 					task_log=task_log,
 					task=task,
 				)
-			else:
-				results.append(result)
+			processing_result, overview_data = result
+			ministry_page_overview_data_list.append(
+				overview_data
+			)
+			ministry_services_identifiers.append(
+				processing_result.ministry_services_identifier
+			)
+			department_entries.extend(
+				processing_result.department_entries.values()
+			)
+			ministry_page_agency_data.extend(
+				processing_result.ministry_page_agency_data.values()
+			)
 
 		# Batch apply observed data from
 		# processing each ministry page to handler state
-		ministry_page_overview_data_list = [
-			result[1] for result in results
-		]
 		self._apply_ministry_page_overview_data_batch(
 			ministry_page_overview_data_list,
 			task_log,
 			task,
 		)
 
-		# Extract data from results to pass
-		# to other handlers and update scheduler state
-		ministry_page_processing_results = [
-			result[0] for result in results
-		]
-
-		# Flatten data for return
-		ministry_services_identifiers: list[
-			MinistryServicesIdentifier
-		] = []
-		department_entries: list[DepartmentEntry] = []
-		ministry_page_agency_data: list[
-			MinistryPageAgencyData
-		] = []
-		for (
-			ministry_page_processing_result
-		) in ministry_page_processing_results:
-			ministry_services_identifiers.append(
-				ministry_page_processing_result.ministry_services_identifier
-			)
-			department_entries.extend(
-				ministry_page_processing_result.department_entries.values()
-			)
-			ministry_page_agency_data.extend(
-				ministry_page_processing_result.ministry_page_agency_data.values()
-			)
-
 		ministry_services_identifiers_list = (  # noqa: E501
 			MinistryServicesIdentifiersList(
 				ministry_services_identifiers=ministry_services_identifiers
@@ -675,13 +823,15 @@ class MinistriesHandler:
 	async def _process_ministry_page_services_data(
 		self,
 		service_task: ServiceTaskPayload,
+		services_html: str | None,
 		task_log: str,
 		task: SchedulerTask,
 	) -> list[ServiceEntry]:
 		"""
 		Method to process the raw HTML content of a
-		ministry services page into structured service
-		data.
+		ministry services page, read in batch by the
+		caller with None for a missing file, into
+		structured service data.
 		"""
 		services_file = (
 			self._build_ministry_services_file_path(
@@ -691,14 +841,19 @@ class MinistriesHandler:
 			)
 		)
 
-		if not does_file_exist(services_file):
+		if services_html is None:
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Ministry services file does not exist '
-				f'for {service_task.ministry_id} under '
-				f'department {service_task.department_id} '
-				f'and agency {service_task.agency_id} at '
-				f'{services_file!r}, cannot process data.',
+				'[%s]\n'
+				'Ministry services file does not exist '
+				'for %s under '
+				'department %s '
+				'and agency %s at '
+				'%r, cannot process data.',
+				self.handler_name,
+				service_task.ministry_id,
+				service_task.department_id,
+				service_task.agency_id,
+				services_file,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -711,22 +866,29 @@ class MinistriesHandler:
 				task=task,
 			)
 
-		services_html = read_file(services_file)
-		service_entries = (
-			ministry_service_processing_recipe(
-				html=services_html,
-				ministry_id=service_task.ministry_id,
-				department_id=service_task.department_id,
-				agency_id=service_task.agency_id,
-			)
+		# Parse in a worker process so the pages of a
+		# task list parse in parallel
+		loop = asyncio.get_running_loop()
+		service_entries = await loop.run_in_executor(
+			self._cpu_pool,
+			ministry_service_processing_recipe,
+			services_html,
+			service_task.ministry_id,
+			service_task.department_id,
+			service_task.agency_id,
 		)
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministry services data processed for '
-			f'{len(service_entries)} services under '
-			f'ministry {service_task.ministry_id}, '
-			f'department {service_task.department_id} and '
-			f'agency {service_task.agency_id}.',
+			'[%s]\n'
+			'Ministry services data processed for '
+			'%s services under '
+			'ministry %s, '
+			'department %s and '
+			'agency %s.',
+			self.handler_name,
+			len(service_entries),
+			service_task.ministry_id,
+			service_task.department_id,
+			service_task.agency_id,
 			extra={'task': task_log},
 		)
 		return list(service_entries.values())
@@ -750,18 +912,30 @@ class MinistriesHandler:
 		operations.
 		"""
 		# Make sure all tasks in the list belong to the
-		# same ministry
-		ministry_ids = set(
-			task.ministry_id
-			for task in service_task_list.service_tasks
-		)
-		if len(ministry_ids) != 1:
+		# same ministry, comparing against the first task
+		# and only collecting the distinct IDs to report
+		service_tasks = service_task_list.service_tasks
+		task_ministry_id = (
+			service_tasks[0].ministry_id
+			if service_tasks
+			else None
+		)
+		if task_ministry_id is None or any(
+			service_task.ministry_id != task_ministry_id
+			for service_task in service_tasks
+		):
+			ministry_ids = {
+				service_task.ministry_id
+				for service_task in service_tasks
+			}
 			logger.error(
-				f'[{self.handler_name}]\n'
+				'[%s]\n'
 				'Service task list contains tasks for '
-				f'multiple ministries: {ministry_ids}. '
+				'multiple ministries: %s. '
 				'All tasks in a service task list should '
 				'belong to the same ministry.',
+				self.handler_name,
+				ministry_ids,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -773,61 +947,78 @@ class MinistriesHandler:
 				task=task,
 			)
 
-		task_ministry_id = ministry_ids.pop()
-
-		# Process each service task in the list
-		tasks = [
-			asyncio.create_task(
-				self._process_ministry_page_services_data(
-					service_task=service_task,
-					task_log=task_log,
-					task=task,
+		# Read every services page in one batch
+		services_html = await read_files_async(
+			self._build_ministry_services_file_path(
+				service_task.ministry_id,
+				service_task.department_id,
+				service_task.agency_id,
+			)
+			for service_task in service_tasks
+		)
+
+		# Process each service task in the list. Parsing
+		# runs in the worker processes, so the pages are
+		# gathered and stop at the first failure
+		try:
+			results = await asyncio.gather(
+				*(
+					self._process_ministry_page_services_data(
+						service_task=service_task,
+						services_html=html,
+						task_log=task_log,
+						task=task,
+					)
+					for service_task, html in zip(
+						service_tasks,
+						services_html,
+						strict=True,
+					)
 				)
 			)
-			for service_task in service_task_list.service_tasks  # noqa: E501
-		]
-		raw_results: list[
-			list[ServiceEntry] | BaseException
-		] = await asyncio.gather(
-			*tasks, return_exceptions=True
+		except Exception as e:
+			logger.error(
+				'[%s]\n'
+				'Error processing service task list: '
+				'%r',
+				self.handler_name,
+				e,
+				extra={'task': task_log},
+			)
+			raise ExecutorProcessingFailure(
+				message=f'Error processing service '
+				f'task list: {e!r}',
+				task_log=task_log,
+				task=task,
+			) from e
+		service_entries: list[ServiceEntry] = list(
+			chain.from_iterable(results)
 		)
 
-		# Check for exceptions in results
-		for result in raw_results:
-			if isinstance(result, BaseException):
-				logger.error(
-					f'[{self.handler_name}]\n'
-					f'Error processing service task list: '
-					f'{result!r}',
-					extra={'task': task_log},
-				)
-				raise ExecutorProcessingFailure(
-					message=f'Error processing service '
-					f'task list: {result!r}',
-					task_log=task_log,
-					task=task,
-				)
-
-		# Flatten list of service entries
-		service_entries: list[ServiceEntry] = [
-			service_entry
-			for sublist in raw_results
-			for service_entry in sublist  # type: ignore
-		]
-
 		# Make sure each service belongs
 		# to the same ministry
-		ministry_ids = set(
+		processing_ministry_id = (
+			service_entries[0].ministry_id
+			if service_entries
+			else None
+		)
+		if processing_ministry_id is None or any(
 			service_entry.ministry_id
+			!= processing_ministry_id
 			for service_entry in service_entries
-		)
-		if len(ministry_ids) != 1:
+		):
+			ministry_ids = {
+				service_entry.ministry_id
+				for service_entry in service_entries
+			}
 			logger.error(
-				f'[{self.handler_name}]\n'
+				'[%s]\n'
 				'Processed service entries belong to '
-				f'multiple ministries: {ministry_ids}. All '
+				'multiple ministries: %s. All '
 				'services processed in a batch should '
 				'belong to the same ministry.',
+				self.handler_name,
+				ministry_ids,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -839,15 +1030,16 @@ class MinistriesHandler:
 				task=task,
 			)
 
-		processing_ministry_id = ministry_ids.pop()
-
 		if processing_ministry_id != task_ministry_id:
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Mismatch between ministry_id of service '
-				f'tasks ({task_ministry_id}) and '
-				f'ministry_id of processed service entries '
-				f'({processing_ministry_id}).',
+				'[%s]\n'
+				'Mismatch between ministry_id of service '
+				'tasks (%s) and '
+				'ministry_id of processed service entries '
+				'(%s).',
+				self.handler_name,
+				task_ministry_id,
+				processing_ministry_id,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -869,12 +1061,16 @@ class MinistriesHandler:
 		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Service task list processed for ministry '
-			f'{processing_ministry_id} '
-			f'with {len(service_entries)} services. '
-			f'Generated services processed identifier: '
-			f'{services_processed_identifier}.',
+			'[%s]\n'
+			'Service task list processed for ministry '
+			'%s '
+			'with %s services. '
+			'Generated services processed identifier: '
+			'%s.',
+			self.handler_name,
+			processing_ministry_id,
+			len(service_entries),
+			services_processed_identifier,
 			extra={'task': task_log},
 		)
 
@@ -894,10 +1090,11 @@ class MinistriesHandler:
 		"""
 		if not self.ministry_entries:
 			logger.warning(
-				f'[{self.handler_name}]\n'
-				f'No ministry entries found in handler '
-				f'state when retrieving ministry '
-				f'identifiers.',
+				'[%s]\n'
+				'No ministry entries found in handler '
+				'state when retrieving ministry '
+				'identifiers.',
+				self.handler_name,
 				extra={'handler': self.handler_name},
 			)
 			raise ExecutorProcessingFailure(
@@ -925,15 +1122,18 @@ class MinistriesHandler:
 		ministry with the data observed from processing
 		the ministry page.
 		"""
-		ministry_entry = self.ministry_entries.get(
-			ministry_id
-		)
-		if not ministry_entry:
+		try:
+			ministry_entry = self.ministry_entries[
+				ministry_id
+			]
+		except KeyError:
 			logger.error(
-				f'[{self.handler_name}]\n'
-				f'Ministry entry not found in handler '
-				f'state for ministry_id {ministry_id} when '
-				f'applying ministry page processed data.',
+				'[%s]\n'
+				'Ministry entry not found in handler '
+				'state for ministry_id %s when '
+				'applying ministry page processed data.',
+				self.handler_name,
+				ministry_id,
 				extra={'task': task_log},
 			)
 			raise ExecutorProcessingFailure(
@@ -943,7 +1143,7 @@ class MinistriesHandler:
 				f'page processed data.',
 				task_log=task_log,
 				task=task,
-			)
+			) from None
 
 		# Update ministry entry with observed data
 		ministry_entry.ministry_description = (
@@ -978,10 +1178,12 @@ class MinistriesHandler:
 			)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Batch applied ministry page overview data '
-			f'for {len(ministry_page_overview_results)} '
-			f'ministries.',
+			'[%s]\n'
+			'Batch applied ministry page overview data '
+			'for %s '
+			'ministries.',
+			self.handler_name,
+			len(ministry_page_overview_results),
 			extra={'task': task_log},
 		)
 
@@ -999,23 +1201,22 @@ class MinistriesHandler:
 			ministry_id,
 			agency_count,
 		) in agency_count_by_ministry.items():
-			if ministry_id in self.ministry_entries:
-				ministry_entry = self.ministry_entries[
-					ministry_id
-				]
+			ministry_entry = self.ministry_entries.get(
+				ministry_id
+			)
+			if ministry_entry is not None:
 				ministry_entry.observed_agency_count = (
 					agency_count
 				)
-				self.ministry_entries[ministry_id] = (
-					ministry_entry
-				)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to ministries '
-			f'state with agency count for '
-			f'{len(agency_count_by_ministry)} '
-			f'ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to ministries '
+			'state with agency count for '
+			'%s '
+			'ministries.',
+			self.handler_name,
+			len(agency_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -1033,23 +1234,22 @@ class MinistriesHandler:
 			ministry_id,
 			service_count,
 		) in service_count_by_ministry.items():
-			if ministry_id in self.ministry_entries:
-				ministry_entry = self.ministry_entries[
-					ministry_id
-				]
+			ministry_entry = self.ministry_entries.get(
+				ministry_id
+			)
+			if ministry_entry is not None:
 				ministry_entry.observed_service_count = (
 					service_count
 				)
-				self.ministry_entries[ministry_id] = (
-					ministry_entry
-				)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to ministries '
-			f'state with service count for '
-			f'{len(service_count_by_ministry)} '
-			f'ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to ministries '
+			'state with service count for '
+			'%s '
+			'ministries.',
+			self.handler_name,
+			len(service_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -1067,23 +1267,22 @@ class MinistriesHandler:
 			ministry_id,
 			department_count,
 		) in department_count_by_ministry.items():
-			if ministry_id in self.ministry_entries:
-				ministry_entry = self.ministry_entries[
-					ministry_id
-				]
+			ministry_entry = self.ministry_entries.get(
+				ministry_id
+			)
+			if ministry_entry is not None:
 				ministry_entry.observed_department_count = (
 					department_count
 				)
-				self.ministry_entries[ministry_id] = (
-					ministry_entry
-				)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to ministries '
-			f'state with department count for '
-			f'{len(department_count_by_ministry)} '
-			f'ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to ministries '
+			'state with department count for '
+			'%s '
+			'ministries.',
+			self.handler_name,
+			len(department_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -1132,8 +1331,11 @@ class MinistriesHandler:
 		self.ministries_insights(ministry_df)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Ministry handler finalised. Processed data '
-			f'saved to {self.processed_data_dir!r} and '
-			f'insights saved to {self.insights_file!r}.',
+			'[%s]\n'
+			'Ministry handler finalised. Processed data '
+			'saved to %r and '
+			'insights saved to %r.',
+			self.handler_name,
+			self.processed_data_dir,
+			self.insights_file,
 		)
@@ -8,6 +8,8 @@ from the ministries pages related to the services.)
 """
 
 import logging
+from collections import Counter
+from operator import attrgetter
 
 import pandas as pd
 
@@ -17,14 +19,13 @@ from scraper.schemas.services import ServiceEntry
 from scraper.static.paths import Paths
 from scraper.utils.files import (
 	does_file_exist,
-	read_file,
 	write_file,
 )
 from scraper.utils.handlers import (
+	load_journaled_state,
 	save_df,
+	save_journaled_state,
 	state_to_df,
-	state_to_str,
-	str_to_state,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,11 @@ class ServicesHandler:
 		self.state_file = (
 			Paths.TEMP_DIR / 'services_handler_state.json'
 		)
+		# Append-only journal of entries changed since
+		# the last full snapshot in state_file
+		self.state_journal_file = (
+			self.state_file.with_suffix('.jsonl')
+		)
 
 		# processed file locations
 		self.processed_data_dir = (
@@ -65,31 +71,40 @@ class ServicesHandler:
 			self._load_state()
 		)
 
+		# Service IDs changed since the last save
+		self._dirty_service_ids: set[str] = set()
+
 	def save_state(self) -> None:
 		"""
-		Method to save the handler state to a file.
+		Method to save the entries changed since the last
+		save, journaled on top of the state snapshot.
 		"""
-		state_str = state_to_str(self.service_entries)
-		write_file(
-			path=self.state_file,
-			content=state_str,
+		save_journaled_state(
+			state=self.service_entries,
+			dirty_keys=self._dirty_service_ids,
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
 		)
 
 	def _load_state(self) -> dict[str, ServiceEntry]:
 		"""
-		Method to load the handler state from a file.
+		Method to load the handler state from the last
+		snapshot file, replaying any journal on top.
 		"""
 		if not does_file_exist(self.state_file):
 			logger.debug(
-				f'[{self.handler_name}]\n'
-				f'State file not found at '
-				f'{self.state_file!r}, starting with '
-				f'empty state.',
+				'[%s]\n'
+				'State file not found at '
+				'%r, starting with '
+				'empty state.',
+				self.handler_name,
+				self.state_file,
 			)
-			return {}
-
-		state_str = read_file(self.state_file)
-		return str_to_state(state_str, ServiceEntry)
+		return load_journaled_state(
+			state_file=self.state_file,
+			journal_file=self.state_journal_file,
+			model_cls=ServiceEntry,
+		)
 
 	# --- Processing methods --- #
 
@@ -109,12 +124,17 @@ class ServicesHandler:
 			self.service_entries[
 				service_entry.service_id
 			] = service_entry
+			self._dirty_service_ids.add(
+				service_entry.service_id
+			)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Applied update to services '
-			f'state with {len(service_entry_list)} '
-			f'service entries.',
+			'[%s]\n'
+			'[TASK INFO]: Applied update to services '
+			'state with %s '
+			'service entries.',
+			self.handler_name,
+			len(service_entry_list),
 			extra={'task': task_log},
 		)
 
@@ -130,19 +150,22 @@ class ServicesHandler:
 		Returns a dictionary mapping agency IDs to
 		the count of services they offer.
 		"""
-		service_count_by_agency: dict[str, int] = {}
-
-		for service_entry in self.service_entries.values():
-			agency_id = service_entry.agency_id
-			if agency_id not in service_count_by_agency:
-				service_count_by_agency[agency_id] = 0
-			service_count_by_agency[agency_id] += 1
+		service_count_by_agency = dict(
+			Counter(
+				map(
+					attrgetter('agency_id'),
+					self.service_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed service count by '
-			f'agency for {len(service_count_by_agency)} '
-			f'agencies.',
+			'[%s]\n'
+			'[TASK INFO]: Computed service count by '
+			'agency for %s '
+			'agencies.',
+			self.handler_name,
+			len(service_count_by_agency),
 			extra={'task': task_log},
 		)
 
@@ -158,25 +181,23 @@ class ServicesHandler:
 		Returns a dictionary mapping department IDs to
 		the count of services they offer.
 		"""
-		service_count_by_department: dict[str, int] = {}
-
-		for service_entry in self.service_entries.values():
-			department_id = service_entry.department_id
-			if (
-				department_id
-				not in service_count_by_department
-			):
-				service_count_by_department[
-					department_id
-				] = 0
-			service_count_by_department[department_id] += 1
+		service_count_by_department = dict(
+			Counter(
+				map(
+					attrgetter('department_id'),
+					self.service_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed service count by '
-			f'department for  '
-			f'{len(service_count_by_department)} '
-			f'departments.',
+			'[%s]\n'
+			'[TASK INFO]: Computed service count by '
+			'department for  '
+			'%s '
+			'departments.',
+			self.handler_name,
+			len(service_count_by_department),
 			extra={'task': task_log},
 		)
 
@@ -192,19 +213,22 @@ class ServicesHandler:
 		Returns a dictionary mapping ministry IDs to
 		the count of services they offer.
 		"""
-		service_count_by_ministry: dict[str, int] = {}
-
-		for service_entry in self.service_entries.values():
-			ministry_id = service_entry.ministry_id
-			if ministry_id not in service_count_by_ministry:
-				service_count_by_ministry[ministry_id] = 0
-			service_count_by_ministry[ministry_id] += 1
+		service_count_by_ministry = dict(
+			Counter(
+				map(
+					attrgetter('ministry_id'),
+					self.service_entries.values(),
+				)
+			)
+		)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'[TASK INFO]: Computed service count by '
-			f'ministry for '
-			f'{len(service_count_by_ministry)} ministries.',
+			'[%s]\n'
+			'[TASK INFO]: Computed service count by '
+			'ministry for '
+			'%s ministries.',
+			self.handler_name,
+			len(service_count_by_ministry),
 			extra={'task': task_log},
 		)
 
@@ -260,8 +284,11 @@ class ServicesHandler:
 		self.services_insights(service_df)
 
 		logger.debug(
-			f'[{self.handler_name}]\n'
-			f'Services handler finalised. Processed data '
-			f'saved to {self.processed_data_dir!r} and '
-			f'insights saved to {self.insights_file!r}.',
+			'[%s]\n'
+			'Services handler finalised. Processed data '
+			'saved to %r and '
+			'insights saved to %r.',
+			self.handler_name,
+			self.processed_data_dir,
+			self.insights_file,
 		)
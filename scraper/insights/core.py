@@ -242,9 +242,11 @@ def render_missing_data_section(
 		)
 		return '\n'.join(lines)
 
-	# Missingness by column
-	missing_counts = (
-		df[cols].isna().sum().sort_values(ascending=False)
+	# Missingness by column, the mask is computed once
+	# and reused for the per column record detail
+	missing = df[cols].isna()
+	missing_counts = missing.sum().sort_values(
+		ascending=False
 	)
 	total_rows = int(len(df))
 
@@ -275,8 +277,11 @@ def render_missing_data_section(
 
 		lines.append(f'\n#### `{col}`\n')
 
-		missing_rows = df[df[col].isna()]
-		ids = missing_rows[id_col].astype(str).tolist()
+		ids = (
+			df.loc[missing[col], id_col]
+			.astype(str)
+			.tolist()
+		)
 
 		lines.append(f'- Missing rows: {cnt_int}')
 		lines.append(
@@ -4,7 +4,7 @@ turning the raw HTML content of the agencies list
 page into structured AgencyEntry data.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scraper.exceptions.executor import (
 	ExecutorProcessingFailure,
@@ -17,6 +17,10 @@ from scraper.utils.normalise import (
 	normalise_url,
 )
 
+# Only the agency links are read, so parsing is
+# limited to them
+_AGENCY_LINKS = SoupStrainer('a')
+
 
 def agencies_list_processing_recipe(
 	html: str, task_log: str, task: SchedulerTask
@@ -25,7 +29,9 @@ def agencies_list_processing_recipe(
 	Recipe to process the raw HTML content of
 	the agencies list page.
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_AGENCY_LINKS
+	)
 	agency_items = soup.find_all('a')
 
 	agency_entries: dict[str, AgencyEntry] = {}
@@ -6,7 +6,7 @@ structured FAQEntry data.
 
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scraper.exceptions.executor import (
 	ExecutorProcessingFailure,
@@ -16,6 +16,10 @@ from scraper.schemas.scheduler_task import SchedulerTask
 from scraper.utils.hashing import stable_id
 from scraper.utils.normalise import normalise_text
 
+# Only the FAQ items are read, so parsing is limited
+# to them
+_FAQ_ITEMS = SoupStrainer('li', id=re.compile(r'^faq_'))
+
 
 def faq_page_processing_recipe(
 	html: str, task_log: str, task: SchedulerTask
@@ -24,7 +28,9 @@ def faq_page_processing_recipe(
 	Recipe to process the raw HTML content of
 	the FAQ page.
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_FAQ_ITEMS
+	)
 	faq_items = soup.find_all('li', id=re.compile(r'^faq_'))
 	faq_entries: dict[str, FAQEntry] = {}
 
@@ -6,7 +6,7 @@ pages into structured data.
 
 from urllib.parse import parse_qs, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scraper.schemas.departments import DepartmentEntry
 from scraper.schemas.ministries import (
@@ -21,6 +21,14 @@ from scraper.utils.normalise import (
 	parse_int,
 )
 
+# Each recipe only reads the elements below, so parsing
+# is limited to them and their subtrees
+_OVERVIEW_TAGS = SoupStrainer(['dd', 'article'])
+_DEPARTMENTS_AGENCIES_ROOT = SoupStrainer(
+	'ul', role='listbox'
+)
+_SERVICE_LINKS = SoupStrainer('a')
+
 
 def ministry_overview_processing_recipe(
 	html: str, ministry_id: str
@@ -29,7 +37,9 @@ def ministry_overview_processing_recipe(
 	Recipe to process the raw HTML content of
 	the ministry overview page.
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_OVERVIEW_TAGS
+	)
 
 	# Reported counts are in dd tags
 	# agencies count is in the first dd,
@@ -128,7 +138,9 @@ def ministry_departments_agencies_processing_recipe(
 	- [0]: dict[department_id, DepartmentEntry]
 	- [1]: dict[agency_name_hash, MinistryPageAgencyData]
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_DEPARTMENTS_AGENCIES_ROOT
+	)
 
 	root = soup.find('ul', role='listbox')
 	if root is None:
@@ -201,6 +213,34 @@ def ministry_departments_agencies_processing_recipe(
 	return department_entries, ministry_agencies_data
 
 
+def ministry_page_processing_recipe(
+	ministry_id: str,
+	ministry_url: str,
+	overview_html: str,
+	departments_agencies_html: str,
+) -> tuple[
+	MinistryPageOverviewData,
+	tuple[
+		dict[str, DepartmentEntry],
+		dict[str, MinistryPageAgencyData],
+	],
+]:
+	"""
+	Recipe to process both ministry pages in one call,
+	used to run them together in a worker process.
+	"""
+	return (
+		ministry_overview_processing_recipe(
+			html=overview_html, ministry_id=ministry_id
+		),
+		ministry_departments_agencies_processing_recipe(
+			html=departments_agencies_html,
+			ministry_id=ministry_id,
+			ministry_url=ministry_url,
+		),
+	)
+
+
 def ministry_service_processing_recipe(
 	html: str,
 	ministry_id: str,
@@ -213,7 +253,9 @@ def ministry_service_processing_recipe(
 
 	Returns a dictionary of service_id to ServiceEntry.
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_SERVICE_LINKS
+	)
 
 	service_entries: dict[str, ServiceEntry] = {}
 
@@ -4,7 +4,7 @@ turning the raw HTML content of the Ministries list
 page into structured MinistryEntry data.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scraper.exceptions.executor import (
 	ExecutorProcessingFailure,
@@ -17,6 +17,10 @@ from scraper.utils.normalise import (
 	normalise_url,
 )
 
+# Only the ministry links are read, so parsing is
+# limited to them
+_MINISTRY_LINKS = SoupStrainer('a')
+
 
 def ministries_list_processing_recipe(
 	html: str, task_log: str, task: SchedulerTask
@@ -25,7 +29,9 @@ def ministries_list_processing_recipe(
 	Recipe to process the raw HTML content of
 	the Ministries list page.
 	"""
-	soup = BeautifulSoup(html, 'lxml')
+	soup = BeautifulSoup(
+		html, 'lxml', parse_only=_MINISTRY_LINKS
+	)
 	ministry_items = soup.find_all('a')
 
 	ministry_entries: dict[str, MinistryEntry] = {}
@@ -11,8 +11,6 @@ import logging
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from scraper.executor.executor import Executor
-from scraper.scheduler.scheduler import Scheduler
 from scraper.static.paths import Paths
 from scraper.utils.logging import (
 	format_exception,
@@ -27,6 +25,12 @@ logger = logging.getLogger(__name__)
 
 
 async def main():
+	# Imported here rather than at module level as the
+	# handlers' spawned parse workers re-import this
+	# module, and only need the processing recipes
+	from scraper.executor.executor import Executor
+	from scraper.scheduler.scheduler import Scheduler
+
 	# Configure logging
 	setup_logging(
 		log_file=Paths.LOGS_DIR / 'scraper.log',
@@ -4,7 +4,9 @@ including task scheduling and state management.
 """
 
 import logging
-from collections import deque
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
 
 from scraper.exceptions.scheduler import (
 	SchedulerDiscoveryTypeMismatch,
@@ -22,10 +24,9 @@ from scraper.schemas.scheduler_task import (
 	# Task payload schemas
 	EmptyPayload,
 	EmptyTask,
-	MinistryIdentifier,
 	MinistryIdentifiers,
 	MinistryListTask,
-	MinistryServicesIdentifiersList,
+	MinistryServicesIdentifier,
 	# Task schemas
 	MinistryTask,
 	MinistryTaskListPayload,
@@ -33,7 +34,6 @@ from scraper.schemas.scheduler_task import (
 	SchedulerTask,
 	ScrapingPhase,
 	ServiceListTask,
-	ServicesProcessedIdentifier,
 	ServicesScrapedIdentifier,
 	ServiceTask,
 	ServiceTaskListPayload,
@@ -46,6 +46,68 @@ from scraper.utils.logging import get_task_log
 # logger instance for the scheduler module
 logger = logging.getLogger(__name__)
 
+# Tasks without a payload are constant, so they are
+# built once and reused on every dispatch
+_EMPTY_PAYLOAD = EmptyPayload()
+_TASK_FAQ_SCRAPE = EmptyTask(
+	scope=ScrapingPhase.FAQ,
+	operation=TaskOperation.FAQ_SCRAPE,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_FAQ_PROCESS = EmptyTask(
+	scope=ScrapingPhase.FAQ,
+	operation=TaskOperation.FAQ_PROCESS,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_AGENCIES_LIST_SCRAPE = EmptyTask(
+	scope=ScrapingPhase.AGENCIES_LIST,
+	operation=TaskOperation.AGENCIES_LIST_SCRAPE,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_AGENCIES_LIST_PROCESS = EmptyTask(
+	scope=ScrapingPhase.AGENCIES_LIST,
+	operation=TaskOperation.AGENCIES_LIST_PROCESS,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_MINISTRIES_LIST_SCRAPE = EmptyTask(
+	scope=ScrapingPhase.MINISTRIES_LIST,
+	operation=TaskOperation.MINISTRIES_LIST_SCRAPE,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_MINISTRIES_LIST_PROCESS = EmptyTask(
+	scope=ScrapingPhase.MINISTRIES_LIST,
+	operation=TaskOperation.MINISTRIES_LIST_PROCESS,
+	payload=_EMPTY_PAYLOAD,
+)
+_TASK_FINALISATION_CHECKS = EmptyTask(
+	scope=ScrapingPhase.FINALISATION,
+	operation=TaskOperation.FINALISATION_CHECKS,
+	payload=_EMPTY_PAYLOAD,
+)
+
+
+class _ServiceRow(NamedTuple):
+	"""
+	Lightweight row for a queued service, materialised
+	into a ServiceTaskPayload only when dispatched.
+	"""
+
+	ministry_id: str
+	department_id: str
+	agency_id: str
+	url: str
+
+	def to_payload(self) -> ServiceTaskPayload:
+		"""
+		Materialise the row into a task payload.
+		"""
+		return ServiceTaskPayload(
+			ministry_id=self.ministry_id,
+			department_id=self.department_id,
+			agency_id=self.agency_id,
+			ministry_departments_agencies_url=self.url,
+		)
+
 
 class Scheduler:
 	"""
@@ -65,33 +127,109 @@ class Scheduler:
 		self.current_task: SchedulerTask | None = None
 		# Queues for ministries page scraping and
 		# processing tasks
+		incomplete = (
+			self._state_manager.get_incomplete_ministries()
+		)
 		self._ministries_page_scrape_queue: deque[
 			MinistryState
-		] = self._initialize_ministries_page_scrape_queue(
-			self._state_manager.get_state()
+		]
+		self._ministries_services_queue: OrderedDict[
+			str, deque[_ServiceRow]
+		]
+		(
+			self._ministries_page_scrape_queue,
+			self._ministries_services_queue,
+		) = self._build_initial_queues(incomplete)
+		# Companion indexes for O(1) membership checks
+		# when appending newly discovered work to queues
+		self._ministries_page_scrape_ids: set[str] = {
+			m.ministry_id
+			for m in self._ministries_page_scrape_queue
+		}
+		self._service_scrape_keys: set[
+			tuple[str, str, str]
+		] = {
+			row[:3]
+			for services_queue in (
+				self._ministries_services_queue.values()
+			)
+			for row in services_queue
+		}
+		# Pending processing work, maintained by the
+		# reducers so payloads are drained directly
+		# rather than derived by scanning the state
+		self._pending_page_processing: deque[
+			MinistryTaskPayload
+		] = self._initialise_pending_page_processing(
+			incomplete
 		)
-		self._ministries_services_queue: deque[
-			tuple[str, deque[ServiceTaskPayload]]
-		] = self._initialise_ministries_services_queue(
-			self._state_manager.get_state()
+		self._pending_service_processing: dict[
+			str, deque[_ServiceRow]
+		] = self._initialise_pending_service_processing(
+			incomplete
 		)
-		# Reducers for applying task results to update state
-		self._reducers = {
-			ScrapingPhase.FAQ: (self._r_faq),
+		# Phase dispatch table for next task determination,
+		# with the order in which phases are advanced
+		self._phase_dispatch: dict[
+			ScrapingPhase,
+			Callable[
+				[SchedulerState], SchedulerTask | None
+			],
+		] = {
+			ScrapingPhase.FAQ: self._next_faq_task,
 			ScrapingPhase.AGENCIES_LIST: (
-				self._r_agencies_list
+				self._next_agencies_list_task
 			),
 			ScrapingPhase.MINISTRIES_LIST: (
-				self._r_ministries_list
+				self._next_ministries_list_task
 			),
 			ScrapingPhase.MINISTRIES_PAGES: (
-				self._r_ministries_pages
+				self._next_ministries_pages_task
 			),
 			ScrapingPhase.MINISTRIES_SERVICES: (
-				self._r_ministries_services
+				self._next_ministries_services_task
 			),
 			ScrapingPhase.FINALISATION: (
-				self._r_finalisation
+				self._next_finalisation_task
+			),
+		}
+		phases = tuple(self._phase_dispatch)
+		self._next_phase: dict[
+			ScrapingPhase, ScrapingPhase
+		] = dict(zip(phases, phases[1:], strict=False))
+		# Reducers for applying task results to update
+		# state, keyed by task operation
+		self._op_handlers: dict[
+			TaskOperation, Callable[[TaskResult], None]
+		] = {
+			TaskOperation.FAQ_SCRAPE: self._on_faq_scrape,
+			TaskOperation.FAQ_PROCESS: self._on_faq_process,
+			TaskOperation.AGENCIES_LIST_SCRAPE: (
+				self._on_agencies_list_scrape
+			),
+			TaskOperation.AGENCIES_LIST_PROCESS: (
+				self._on_agencies_list_process
+			),
+			TaskOperation.MINISTRIES_LIST_SCRAPE: (
+				self._on_ministries_list_scrape
+			),
+			TaskOperation.MINISTRIES_LIST_PROCESS: (
+				self._on_ministries_list_process
+			),
+			TaskOperation.MINISTRIES_PAGE_SCRAPE: (
+				self._on_ministries_page_scrape
+			),
+			TaskOperation.MINISTRIES_PAGE_PROCESS: (
+				self._on_ministries_page_process
+			),
+			TaskOperation.MINISTRIES_SERVICES_SCRAPE: (
+				self._on_ministries_services_scrape
+			),
+			TaskOperation.MINISTRIES_SERVICES_PROCESS: (
+				self._on_ministries_services_process
+			),
+			TaskOperation.FINALISATION_CHECKS: (
+				self._on_finalisation_checks
 			),
 		}
 
@@ -101,10 +239,11 @@ class Scheduler:
 		self, message: str, task_result: TaskResult
 	) -> None:
 		task_log = get_task_log(task_result.task)
-		logger.error(
-			message,
-			extra={'task': task_log},
-		)
+		if logger.isEnabledFor(logging.ERROR):
+			logger.error(
+				message,
+				extra={'task': task_log},
+			)
 		if task_result.error_message:
 			message += (
 				f' Error details: '
@@ -120,10 +259,11 @@ class Scheduler:
 		self, message: str, task: SchedulerTask
 	) -> None:
 		task_log = get_task_log(task)
-		logger.error(
-			message,
-			extra={'task': task_log},
-		)
+		if logger.isEnabledFor(logging.ERROR):
+			logger.error(
+				message,
+				extra={'task': task_log},
+			)
 		raise SchedulerProcessFailure(
 			message=message,
 			task_log=task_log,
@@ -138,12 +278,15 @@ class Scheduler:
 		task_result: TaskResult,
 	) -> None:
 		task_log = get_task_log(task_result.task)
-		logger.error(
-			message
-			+ f' Expected type: {target_type}, '
-			+ f'Observed type: {observed_type}',
-			extra={'task': task_log},
-		)
+		# Skip building the detailed message when error
+		# logging is disabled
+		if logger.isEnabledFor(logging.ERROR):
+			logger.error(
+				message
+				+ f' Expected type: {target_type}, '
+				+ f'Observed type: {observed_type}',
+				extra={'task': task_log},
+			)
 		if task_result.error_message:
 			message += (
 				f' Error details: '
@@ -159,62 +302,98 @@ class Scheduler:
 
 	# --- Queue initialization methods ---
 
-	def _initialize_ministries_page_scrape_queue(
-		self, state: SchedulerState
-	) -> deque[MinistryState]:
+	def _build_initial_queues(
+		self, incomplete: Iterable[MinistryState]
+	) -> tuple[
+		deque[MinistryState],
+		OrderedDict[str, deque[_ServiceRow]],
+	]:
 		"""
-		Initialize the queue of ministries pages
-		to be scraped based on the current state.
+		Initialize the ministries page scrape queue and
+		the ministries services queue, keyed by ministry
+		ID in queue order, in a single pass over the
+		incomplete ministries.
 		"""
-		ministries = [
-			m
-			for m in state.ministries_detail.values()
-			if not m.complete and not m.page.scraped
-		]
-		return deque(ministries)
+		page_scrape_queue: deque[MinistryState] = deque()
+		ministry_services_queue_registry: OrderedDict[
+			str, deque[_ServiceRow]
+		] = OrderedDict()
+		for m in incomplete:
+			if not m.page.scraped:
+				page_scrape_queue.append(m)
+			if (
+				not m.services.scraped
+				or not m.services.processed
+			):
+				ministry_services_queue_registry[
+					m.ministry_id
+				] = self._build_ministry_services_queue(m)
 
-	def _initialise_ministries_services_queue(
-		self, state: SchedulerState
-	) -> deque[tuple[str, deque[ServiceTaskPayload]]]:
+		return (
+			page_scrape_queue,
+			ministry_services_queue_registry,
+		)
+
+	def _build_ministry_services_queue(
+		self, ministry_state: MinistryState
+	) -> deque[_ServiceRow]:
 		"""
-		Initialize the queue of ministries services
-		to be scraped based on the current state.
+		Build the queue of services still to be scraped
+		for a single ministry from its state.
 		"""
-		ministries = [
-			m
-			for m in state.ministries_detail.values()
-			if not m.complete
-			and (
-				not m.services.scraped
-				or not m.services.processed
+		ministry_id = ministry_state.ministry_id
+		return deque(
+			_ServiceRow(
+				ministry_id=ministry_id,
+				department_id=d.department_id,
+				agency_id=a.agency_id,
+				url=a.ministry_departments_agencies_url,
 			)
-		]
-		ministry_services_queue_registry: deque[
-			tuple[str, deque[ServiceTaskPayload]]
-		] = deque()
-		for m in ministries:
-			ministry_services_scrape_queue = deque()
+			for d in ministry_state.departments.values()
+			for a in d.agencies.values()
+			if not a.state.scraped
+		)
+
+	def _initialise_pending_page_processing(
+		self, incomplete: Iterable[MinistryState]
+	) -> deque[MinistryTaskPayload]:
+		"""
+		Initialize the queue of ministries with scraped
+		pages still to be processed.
+		"""
+		return deque(
+			MinistryTaskPayload(ministry_id=m.ministry_id)
+			for m in incomplete
+			if not m.page.processed and m.page.scraped
+		)
+
+	def _initialise_pending_service_processing(
+		self, incomplete: Iterable[MinistryState]
+	) -> dict[str, deque[_ServiceRow]]:
+		"""
+		Initialize the scraped services still to be
+		processed, keyed by ministry ID.
+		"""
+		pending: dict[str, deque[_ServiceRow]] = {}
+		for m in incomplete:
 			for d in m.departments.values():
 				for a in d.agencies.values():
-					if not a.state.scraped:
-						ministry_services_scrape_queue.append(
-							ServiceTaskPayload(
-								ministry_id=m.ministry_id,
-								department_id=d.department_id,
-								agency_id=a.agency_id,
-								ministry_departments_agencies_url=(
-									a.ministry_departments_agencies_url
-								),
-							)
+					if (
+						a.state.processed
+						or not a.state.scraped
+					):
+						continue
+					pending.setdefault(
+						m.ministry_id, deque()
+					).append(
+						_ServiceRow(
+							ministry_id=m.ministry_id,
+							department_id=d.department_id,
+							agency_id=a.agency_id,
+							url=a.ministry_departments_agencies_url,
 						)
-			ministry_services_queue_registry.append(
-				(
-					m.ministry_id,
-					ministry_services_scrape_queue,
-				)
-			)
-
-		return ministry_services_queue_registry
+					)
+		return pending
 
 	# --- Queue update methods based on task results ---
 
@@ -223,60 +402,86 @@ class Scheduler:
 	) -> None:
 		"""
 		Pop the ministry with the given ID from the
-		ministries page scrape queue, if it is at the
-		front of the queue.
+		ministries page scrape queue. Ministries not at
+		the front of the queue are dropped from the
+		companion set and skipped on the next dispatch.
 		"""
-		if (
-			self._ministries_page_scrape_queue
-			and self._ministries_page_scrape_queue[
-				0
-			].ministry_id
-			== ministry_id
-		):
-			self._ministries_page_scrape_queue.popleft()
+		ids = self._ministries_page_scrape_ids
+		if ministry_id not in ids:
+			return
+		ids.discard(ministry_id)
+		queue = self._ministries_page_scrape_queue
+		if queue[0].ministry_id == ministry_id:
+			queue.popleft()
 
 	def _pop_service_scrape_queue(
 		self,
 		ministry_id: str,
 		department_id: str,
 		agency_id: str,
-	) -> None:
+	) -> _ServiceRow | None:
 		"""
 		Pop the service with the given ministry, department
 		and agency IDs from the ministries services scrape
-		queue, if it is at the front of the queue for the
-		corresponding ministry.
+		queue. Returns the popped service if it was at the
+		front of the queue for its ministry, otherwise it
+		is dropped from the companion set and skipped on
+		the next dispatch.
 		"""
-		if (
-			self._ministries_services_queue
-			and self._ministries_services_queue[0][0]
-			== ministry_id
-		):
-			services_queue = (
-				self._ministries_services_queue[0][1]
-			)
-			if (
-				services_queue
-				and services_queue[0].department_id
-				== department_id
-				and services_queue[0].agency_id == agency_id
-			):
-				services_queue.popleft()
+		key = (ministry_id, department_id, agency_id)
+		if key not in self._service_scrape_keys:
+			return None
+		self._service_scrape_keys.discard(key)
+		services_queue = (
+			self._ministries_services_queue.get(ministry_id)
+		)
+		if services_queue and services_queue[0][:3] == key:
+			return services_queue.popleft()
+		return None
 
 	def _pop_service_processing_queue(
 		self, ministry_id: str
 	) -> None:
 		"""
 		Pop the ministry with the given ID from the
-		ministries services processing queue, if it is at
-		the front of the queue.
+		ministries services processing queue, wherever
+		it is in the queue.
 		"""
-		if (
-			self._ministries_services_queue
-			and self._ministries_services_queue[0][0]
-			== ministry_id
-		):
-			self._ministries_services_queue.popleft()
+		services_queue = (
+			self._ministries_services_queue.pop(
+				ministry_id, None
+			)
+		)
+		if services_queue:
+			self._service_scrape_keys.difference_update(
+				row[:3] for row in services_queue
+			)
+
+	def _drop_stale_page_scrape_entries(self) -> None:
+		"""
+		Drop ministries from the front of the page scrape
+		queue that were completed out of order.
+		"""
+		queue = self._ministries_page_scrape_queue
+		ids = self._ministries_page_scrape_ids
+		while queue and queue[0].ministry_id not in ids:
+			queue.popleft()
+
+	def _drop_stale_service_entries(self) -> None:
+		"""
+		Drop services from the front of the services
+		queue of the next ministry that were completed
+		out of order.
+		"""
+		queue = self._ministries_services_queue
+		if queue:
+			services_queue = next(iter(queue.values()))
+			keys = self._service_scrape_keys
+			while (
+				services_queue
+				and services_queue[0][:3] not in keys
+			):
+				services_queue.popleft()
 
 	# --- State update methods for scheduler ---
 
@@ -299,8 +504,8 @@ class Scheduler:
 		"""
 		Update the state with the discovered ministry
 		identifiers from the ministries list processing
-		task, and update the ministries page scrape
-		queue accordingly.
+		task, and append any newly discovered ministries
+		to the ministries page scrape queue.
 		"""
 
 		ministry_ids = ministry_identifiers.ministry_ids
@@ -310,51 +515,138 @@ class Scheduler:
 			ministry_ids=ministry_ids
 		)
 
-		# Apply to scrape queue
+		# Append only ministries not already queued
 		state = self._state_manager.get_state()
-		self._ministries_page_scrape_queue = (
-			self._initialize_ministries_page_scrape_queue(
-				state
-			)
-		)
+		queued = self._ministries_page_scrape_ids
+		for ministry_id in ministry_ids:
+			if ministry_id in queued:
+				continue
+			m = state.ministries_detail.get(ministry_id)
+			if m and not m.complete and not m.page.scraped:
+				self._ministries_page_scrape_queue.append(m)
+				queued.add(ministry_id)
 
 	def _apply_ministry_services_to_scrape_queue(
 		self,
+		ministry_services_identifier: (
+			MinistryServicesIdentifier | None
+		) = None,
 	) -> None:
 		"""
-		Update the queue for ministries services scraping
-		with the discovered ministry services identifier
-		from the ministry page scraping task.
+		Append the discovered ministry services from a
+		ministry page processing task to the ministries
+		services queue. Without an identifier, any
+		eligible ministries in state that are not yet
+		queued are appended instead.
 		"""
-		state = self._state_manager.get_state()
-		self._ministries_services_queue = (
-			self._initialise_ministries_services_queue(
-				state
+		if ministry_services_identifier is None:
+			incomplete = self._state_manager.get_incomplete_ministries()  # noqa: E501
+			for m in incomplete:
+				if (
+					m.ministry_id
+					in self._ministries_services_queue
+					or (
+						m.services.scraped
+						and m.services.processed
+					)
+				):
+					continue
+				self._append_ministry_services_queue(
+					m.ministry_id,
+					self._build_ministry_services_queue(m),
+				)
+			return
+
+		ministry_id = (
+			ministry_services_identifier.ministry_id
+		)
+		new_services = deque(
+			_ServiceRow(
+				ministry_id=ministry_id,
+				department_id=department_id,
+				agency_id=agency_id,
+				url=a.ministry_departments_agencies_url,
+			)
+			for department_id, d in (
+				ministry_services_identifier.departments.items()
 			)
+			for agency_id, a in d.agencies.items()
+		)
+
+		services_queue = (
+			self._ministries_services_queue.get(ministry_id)
+		)
+		if services_queue is None:
+			self._append_ministry_services_queue(
+				ministry_id, new_services
+			)
+			return
+
+		# Ministry already queued, extend its services
+		# queue with any services not already present
+		for row in new_services:
+			if row[:3] not in self._service_scrape_keys:
+				services_queue.append(row)
+				self._service_scrape_keys.add(row[:3])
+
+	def _append_ministry_services_queue(
+		self,
+		ministry_id: str,
+		services_queue: deque[_ServiceRow],
+	) -> None:
+		"""
+		Append a ministry and its services queue to the
+		ministries services queue and companion set.
+		"""
+		self._ministries_services_queue[ministry_id] = (
+			services_queue
+		)
+		self._service_scrape_keys.update(
+			row[:3] for row in services_queue
 		)
 
 	# --- Task payload generation methods ---
 
+	def _service_payload_from_state(
+		self, identifier: ServicesScrapedIdentifier
+	) -> _ServiceRow | None:
+		"""
+		Build a service payload from the state for a
+		scraped service that was not at the front of
+		the services scrape queue.
+		"""
+		state = self._state_manager.get_state()
+		ministry_state = state.ministries_detail.get(
+			identifier.ministry_id
+		)
+		if not ministry_state:
+			return None
+		department_state = ministry_state.departments.get(
+			identifier.department_id
+		)
+		if not department_state:
+			return None
+		agency_state = department_state.agencies.get(
+			identifier.agency_id
+		)
+		if not agency_state:
+			return None
+		return _ServiceRow(
+			ministry_id=identifier.ministry_id,
+			department_id=identifier.department_id,
+			agency_id=identifier.agency_id,
+			url=agency_state.ministry_departments_agencies_url,
+		)
+
 	def _get_ministry_pages_to_process(
-		self, state: SchedulerState
+		self,
 	) -> MinistryTaskListPayload:
 		"""
 		Get the list of ministries that still need their
 		detail pages processed.
 		"""
-		ministries = [
-			m
-			for m in state.ministries_detail.values()
-			if not m.complete
-			and (not m.page.processed and m.page.scraped)
-		]
 		return MinistryTaskListPayload(
-			ministry_ids=[
-				MinistryTaskPayload(
-					ministry_id=m.ministry_id
-				)
-				for m in ministries
-			]
+			ministry_ids=list(self._pending_page_processing)
 		)
 
 	def _get_ministry_services_to_process(
@@ -399,26 +691,18 @@ class Scheduler:
 			# will always raise an exception
 			raise Exception()
 
-		service_tasks: list[ServiceTaskPayload] = []
-		for d in ministry_state.departments.values():
-			for a in d.agencies.values():
-				if (
-					not a.state.processed
-					and a.state.scraped
-				):
-					service_tasks.append(
-						ServiceTaskPayload(
-							ministry_id=ministry_id,
-							department_id=d.department_id,
-							agency_id=a.agency_id,
-							ministry_departments_agencies_url=(
-								a.ministry_departments_agencies_url
-							),
-						)
-					)
+		# Nothing left to process for finished ministries
+		if (
+			ministry_state.complete
+			or ministry_state.services.processed
+		):
+			return ServiceTaskListPayload(service_tasks=[])
 
+		rows = self._pending_service_processing.get(
+			ministry_id, ()
+		)
 		return ServiceTaskListPayload(
-			service_tasks=service_tasks
+			service_tasks=[row.to_payload() for row in rows]
 		)
 
 	# --- Next task determination methods ---
@@ -430,29 +714,29 @@ class Scheduler:
 		Determine the next ministry page scrape task
 		based on the queue of ministries to be scraped.
 		"""
-		if not self._ministries_page_scrape_queue:
+		self._drop_stale_page_scrape_entries()
+		queue = self._ministries_page_scrape_queue
+		if not queue:
 			return None
 
 		# Peek at the next ministry to scrape without
 		# removing it from the queue yet, as we only
 		# want to remove it once the task is completed and
 		# the state is updated accordingly
-		next_ministry = self._ministries_page_scrape_queue[
-			0
-		]
+		ministry_id = queue[0].ministry_id
 		logger.info(
 			f'[SCHEDULER]\n'
 			f'[PHASE INFO]: Scheduling scrape task for '
 			f'ministry page with ID '
-			f'{next_ministry.ministry_id}.'
-			f'{len(self._ministries_page_scrape_queue)} '
+			f'{ministry_id}.'
+			f'{len(queue)} '
 			f'ministry pages left in queue.'
 		)
 		return MinistryTask(
 			scope=ScrapingPhase.MINISTRIES_PAGES,
 			operation=TaskOperation.MINISTRIES_PAGE_SCRAPE,
 			payload=MinistryTaskPayload(
-				ministry_id=next_ministry.ministry_id,
+				ministry_id=ministry_id,
 			),
 		)
 
@@ -464,7 +748,9 @@ class Scheduler:
 		process based on the current state and the queue
 		of ministries and their services.
 		"""
-		if not self._ministries_services_queue:
+		self._drop_stale_service_entries()
+		queue = self._ministries_services_queue
+		if not queue:
 			logger.info(
 				'[SCHEDULER]\n'
 				'[PHASE INFO]: Ministries services queue '
@@ -472,8 +758,8 @@ class Scheduler:
 			)
 			return None
 
-		next_ministry_id, services_queue = (
-			self._ministries_services_queue[0]
+		next_ministry_id, services_queue = next(
+			iter(queue.items())
 		)
 		if not services_queue:
 			# If there are no services to scrape for this
@@ -487,7 +773,7 @@ class Scheduler:
 				f'for ministry ID {next_ministry_id}, '
 				f'moving to processing tasks for the '
 				f'ministry.'
-				f'{len(self._ministries_services_queue)} '
+				f'{len(queue)} '
 				f'ministries left in queue.'
 			)
 			return ServiceListTask(
@@ -514,30 +800,22 @@ class Scheduler:
 			return ServiceTask(
 				scope=ScrapingPhase.MINISTRIES_SERVICES,
 				operation=TaskOperation.MINISTRIES_SERVICES_SCRAPE,
-				payload=next_service,
+				payload=next_service.to_payload(),
 			)
 
-	def next_task(self) -> SchedulerTask | None:
+	def _next_faq_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
 		"""
-		Using the current state, determine the
-		next task to be executed.
+		Determine the next task for the FAQ phase.
 		"""
-		state: SchedulerState = (
-			self._state_manager.get_state()
-		)
-
-		# FAQ phase
 		if not state.faq.scraped:
 			logger.info(
 				'[SCHEDULER]\n'
 				'[PHASE INFO]: FAQ page not yet scraped, '
 				'scheduling FAQ page scrape task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.FAQ,
-				operation=TaskOperation.FAQ_SCRAPE,
-				payload=EmptyPayload(),
-			)
+			return _TASK_FAQ_SCRAPE
 
 		if not state.faq.processed:
 			logger.info(
@@ -545,13 +823,17 @@ class Scheduler:
 				'[PHASE INFO]: FAQ page not yet processed, '
 				'scheduling FAQ page processing task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.FAQ,
-				operation=TaskOperation.FAQ_PROCESS,
-				payload=EmptyPayload(),
-			)
+			return _TASK_FAQ_PROCESS
 
-		# Agencies list phase
+		return None
+
+	def _next_agencies_list_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
+		"""
+		Determine the next task for the agencies
+		list phase.
+		"""
 		if not state.agencies_list.scraped:
 			logger.info(
 				'[SCHEDULER]\n'
@@ -559,11 +841,7 @@ class Scheduler:
 				'scraped, scheduling agencies list scrape '
 				'task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.AGENCIES_LIST,
-				operation=TaskOperation.AGENCIES_LIST_SCRAPE,
-				payload=EmptyPayload(),
-			)
+			return _TASK_AGENCIES_LIST_SCRAPE
 
 		if not state.agencies_list.processed:
 			logger.info(
@@ -572,13 +850,17 @@ class Scheduler:
 				'processed, scheduling agencies list '
 				'processing task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.AGENCIES_LIST,
-				operation=TaskOperation.AGENCIES_LIST_PROCESS,
-				payload=EmptyPayload(),
-			)
+			return _TASK_AGENCIES_LIST_PROCESS
+
+		return None
 
-		# Ministries list phase
+	def _next_ministries_list_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
+		"""
+		Determine the next task for the ministries
+		list phase.
+		"""
 		if not state.ministries_list.scraped:
 			logger.info(
 				'[SCHEDULER]\n'
@@ -586,11 +868,7 @@ class Scheduler:
 				'scraped, scheduling ministries list '
 				'scrape task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.MINISTRIES_LIST,
-				operation=TaskOperation.MINISTRIES_LIST_SCRAPE,
-				payload=EmptyPayload(),
-			)
+			return _TASK_MINISTRIES_LIST_SCRAPE
 
 		if not state.ministries_list.processed:
 			logger.info(
@@ -599,13 +877,17 @@ class Scheduler:
 				'processed, scheduling ministries list '
 				'processing task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.MINISTRIES_LIST,
-				operation=TaskOperation.MINISTRIES_LIST_PROCESS,
-				payload=EmptyPayload(),
-			)
+			return _TASK_MINISTRIES_LIST_PROCESS
 
-		# Ministries page phase
+		return None
+
+	def _next_ministries_pages_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
+		"""
+		Determine the next task for the ministries
+		pages phase.
+		"""
 		if not state.ministry_pages.scraped:
 			logger.info(
 				'[SCHEDULER]\n'
@@ -628,9 +910,7 @@ class Scheduler:
 				return MinistryListTask(
 					scope=ScrapingPhase.MINISTRIES_PAGES,
 					operation=TaskOperation.MINISTRIES_PAGE_PROCESS,
-					payload=self._get_ministry_pages_to_process(
-						state
-					),
+					payload=self._get_ministry_pages_to_process(),
 				)
 
 		# Double check if there are any remaining ministry
@@ -645,12 +925,18 @@ class Scheduler:
 			return MinistryListTask(
 				scope=ScrapingPhase.MINISTRIES_PAGES,
 				operation=TaskOperation.MINISTRIES_PAGE_PROCESS,
-				payload=self._get_ministry_pages_to_process(
-					state
-				),
+				payload=self._get_ministry_pages_to_process(),
 			)
 
-		# Ministries services phase
+		return None
+
+	def _next_ministries_services_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
+		"""
+		Determine the next task for the ministries
+		services phase.
+		"""
 		if (
 			not state.ministry_services.scraped
 			or not state.ministry_services.processed
@@ -673,12 +959,17 @@ class Scheduler:
 					'services to scrape, moving to '
 					'finalisation phase.'
 				)
-				return EmptyTask(
-					scope=ScrapingPhase.FINALISATION,
-					operation=TaskOperation.FINALISATION_CHECKS,
-					payload=EmptyPayload(),
-				)
+				return _TASK_FINALISATION_CHECKS
 
+		return None
+
+	def _next_finalisation_task(
+		self, state: SchedulerState
+	) -> SchedulerTask | None:
+		"""
+		Determine the next task for the finalisation
+		phase.
+		"""
 		# Double check all finalisation checks
 		# are done before exiting the scheduler
 		if not state.finalisation_checks:
@@ -688,11 +979,30 @@ class Scheduler:
 				'completed, scheduling finalisation checks '
 				'task.'
 			)
-			return EmptyTask(
-				scope=ScrapingPhase.FINALISATION,
-				operation=TaskOperation.FINALISATION_CHECKS,
-				payload=EmptyPayload(),
-			)
+			return _TASK_FINALISATION_CHECKS
+
+		return None
+
+	def next_task(self) -> SchedulerTask | None:
+		"""
+		Using the current state, determine the
+		next task to be executed. Dispatch starts at
+		the current phase, advancing past phases that
+		have no remaining work.
+		"""
+		state = self._state_manager.get_state()
+		phase = state.current_phase
+
+		while True:
+			task = self._phase_dispatch[phase](state)
+			if task is not None:
+				return task
+
+			next_phase = self._next_phase.get(phase)
+			if next_phase is None:
+				break
+			self._state_manager.advance_phase(next_phase)
+			phase = next_phase
 
 		# If all tasks are complete, return None
 		logger.info(
@@ -704,419 +1014,428 @@ class Scheduler:
 
 	# --- Task result reducer methods ---
 
-	def _r_faq(self, result: TaskResult) -> None:
+	def _on_faq_scrape(self, result: TaskResult) -> None:
 		"""
-		Reducer to handle the result of FAQ scraping
-		and processing tasks and update the state
-		accordingly.
+		Reducer to handle the result of the FAQ scraping
+		task and update the state accordingly.
 		"""
-		if (
-			result.task.operation
-			== TaskOperation.FAQ_SCRAPE
-		):
-			if result.success:
-				self._state_manager.update_faq_state(
-					scraped=True
-				)
-			else:
-				self._phase_failure(
-					message='FAQ scraping task failed',
-					task_result=result,
-				)
-		elif (
-			result.task.operation
-			== TaskOperation.FAQ_PROCESS
-		):
-			if result.success:
-				self._state_manager.update_faq_state(
-					processed=True
-				)
-			else:
-				self._phase_failure(
-					message='FAQ processing task failed',
-					task_result=result,
-				)
+		if result.success:
+			self._state_manager.update_faq_state(
+				scraped=True
+			)
+		else:
+			self._phase_failure(
+				message='FAQ scraping task failed',
+				task_result=result,
+			)
 
-	def _r_agencies_list(self, result: TaskResult) -> None:
+	def _on_faq_process(self, result: TaskResult) -> None:
 		"""
-		Reducer to handle the result of agencies list
-		scraping and processing tasks and update the state
-		accordingly.
+		Reducer to handle the result of the FAQ processing
+		task and update the state accordingly.
 		"""
-		if (
-			result.task.operation
-			== TaskOperation.AGENCIES_LIST_SCRAPE
-		):
-			if result.success:
-				self._state_manager.update_agencies_list_state(
-					scraped=True
-				)
-			else:
-				self._phase_failure(
-					message='Agencies list scraping '
-					'task failed',
-					task_result=result,
-				)
-		elif (
-			result.task.operation
-			== TaskOperation.AGENCIES_LIST_PROCESS
-		):
-			if result.success:
-				self._state_manager.update_agencies_list_state(
-					processed=True
-				)
-			else:
-				self._phase_failure(
-					message='Agencies list processing '
-					'task failed',
-					task_result=result,
-				)
+		if result.success:
+			self._state_manager.update_faq_state(
+				processed=True
+			)
+		else:
+			self._phase_failure(
+				message='FAQ processing task failed',
+				task_result=result,
+			)
+
+	def _on_agencies_list_scrape(
+		self, result: TaskResult
+	) -> None:
+		"""
+		Reducer to handle the result of the agencies list
+		scraping task and update the state accordingly.
+		"""
+		if result.success:
+			self._state_manager.update_agencies_list_state(
+				scraped=True
+			)
+		else:
+			self._phase_failure(
+				message='Agencies list scraping '
+				'task failed',
+				task_result=result,
+			)
+
+	def _on_agencies_list_process(
+		self, result: TaskResult
+	) -> None:
+		"""
+		Reducer to handle the result of the agencies list
+		processing task and update the state accordingly.
+		"""
+		if result.success:
+			self._state_manager.update_agencies_list_state(
+				processed=True
+			)
+		else:
+			self._phase_failure(
+				message='Agencies list processing '
+				'task failed',
+				task_result=result,
+			)
 
-	def _r_ministries_list(
+	def _on_ministries_list_scrape(
 		self, result: TaskResult
 	) -> None:
 		"""
-		Reducer to handle the result of ministries list
-		scraping and processing tasks and update the state
-		accordingly.
+		Reducer to handle the result of the ministries list
+		scraping task and update the state accordingly.
 		"""
+		if result.success:
+			self._state_manager.update_ministries_list_state(
+				scraped=True
+			)
+		else:
+			self._phase_failure(
+				message='Ministries list scraping '
+				'task failed',
+				task_result=result,
+			)
+
+	def _on_ministries_list_process(
+		self, result: TaskResult
+	) -> None:
+		"""
+		Reducer to handle the result of the ministries list
+		processing task and update the state accordingly.
+		"""
+		if not result.success:
+			self._phase_failure(
+				message='Ministries list processing '
+				'task failed',
+				task_result=result,
+			)
+			return
+
+		self._state_manager.update_ministries_list_state(
+			processed=True
+		)
+		# Apply discovered ministries to state
+		# and update the ministries page scrape
+		# queue
+		ministry_identifiers = result.discovered_data
 		if (
-			result.task.operation
-			== TaskOperation.MINISTRIES_LIST_SCRAPE
-		):
-			if result.success:
-				self._state_manager.update_ministries_list_state(
-					scraped=True
-				)
-			else:
-				self._phase_failure(
-					message='Ministries list scraping '
-					'task failed',
-					task_result=result,
-				)
-		elif (
-			result.task.operation
-			== TaskOperation.MINISTRIES_LIST_PROCESS
+			ministry_identifiers.type
+			== 'ministry_identifiers'
 		):
-			if result.success:
-				self._state_manager.update_ministries_list_state(
-					processed=True
-				)
-				# Apply discovered ministries to state
-				# and update the ministries page scrape
-				# queue
-				ministry_identifiers = (
+			self._apply_ministries_list_to_scrape_queue(
+				ministry_identifiers=ministry_identifiers
+			)
+		else:
+			self._discovery_type_mismatch(
+				message=(
+					'Ministries list processing '
+					'task returned unexpected type '
+					'of discovered data.'
+				),
+				target_type='MinistryIdentifiers',
+				observed_type=type(
 					result.discovered_data
-				)
-				if isinstance(
-					ministry_identifiers,
-					MinistryIdentifiers,
-				):
-					self._apply_ministries_list_to_scrape_queue(
-						ministry_identifiers=ministry_identifiers
-					)
-				else:
-					self._discovery_type_mismatch(
-						message=(
-							'Ministries list processing '
-							'task returned unexpected type '
-							'of discovered data.'
-						),
-						target_type='MinistryIdentifiers',
-						observed_type=type(
-							result.discovered_data
-						).__name__,
-						task_result=result,
-					)
-			else:
-				self._phase_failure(
-					message='Ministries list processing '
-					'task failed',
-					task_result=result,
-				)
+				).__name__,
+				task_result=result,
+			)
 
-	def _r_ministries_pages(
+	def _on_ministries_page_scrape(
 		self, result: TaskResult
 	) -> None:
 		"""
-		Reducer to handle the result of ministries page
-		scraping and processing tasks and update the state
-		accordingly.
+		Reducer to handle the result of a ministry page
+		scraping task and update the state accordingly.
 		"""
+		if not result.success:
+			self._phase_failure(
+				message='Ministry page scraping task '
+				'failed',
+				task_result=result,
+			)
+			return
+
+		# Update the state to mark the ministry page
+		# as scraped, and update the scrape queue
+		ministry_identifier = result.discovered_data
 		if (
-			result.task.operation
-			== TaskOperation.MINISTRIES_PAGE_SCRAPE
+			ministry_identifier.type
+			== 'ministry_identifier'
 		):
-			if result.success:
-				# Update the state to mark the ministry page
-				# as scraped, and update the scrape queue
-				# update the ministry service information
-				# with the discovered data from scraping,
-				# which includes the departments and
-				# agencies under the ministry, as well as
-				# their identifiers and URLs
-				ministry_identifier = result.discovered_data
-				if isinstance(
-					ministry_identifier,
-					MinistryIdentifier,
-				):
-					ministry_id = (
-						ministry_identifier.ministry_id
-					)
-					self._state_manager.update_ministry_page_scraped_state(
-						ministry_id=ministry_id
-					)
+			ministry_id = ministry_identifier.ministry_id
+			self._state_manager.update_ministry_page_scraped_state(
+				ministry_id=ministry_id
+			)
 
-					# Remove the ministry from the
-					# scrape queue
-					self._pop_page_scrape_queue(ministry_id)
-
-					# If all pages scraped update global
-					# flag in state
-					q = self._ministries_page_scrape_queue
-					if not q:
-						self._state_manager.check_global_ministries_page_scraped_state()
-
-				else:
-					self._discovery_type_mismatch(
-						message=(
-							'Ministry page scraping task '
-							'returned unexpected type of '
-							'discovered data.'
-						),
-						target_type='MinistryIdentifier',
-						observed_type=type(
-							result.discovered_data
-						).__name__,
-						task_result=result,
-					)
-			else:
-				self._phase_failure(
-					message='Ministry page scraping task '
-					'failed',
-					task_result=result,
-				)
-		elif (
-			result.task.operation
-			== TaskOperation.MINISTRIES_PAGE_PROCESS
-		):
-			if result.success:
-				# Update the state to mark the ministry
-				# pages as processed in batch
-				ministry_services_identifiers_list = (
-					result.discovered_data
-				)
-				if isinstance(
-					ministry_services_identifiers_list,
-					MinistryServicesIdentifiersList,
-				):
-					ministry_services_identifiers = ministry_services_identifiers_list.ministry_services_identifiers  # noqa: E501
-					# Update each ministry with its
-					# processing state and the discovered
-					# services identifiers from processing
-					for (
-						ministry_services_identifier
-					) in ministry_services_identifiers:  # noqa: E501
-						ministry_id = ministry_services_identifier.ministry_id  # noqa: E501
-						# Apply processing result to state
-						self._state_manager.update_ministry_page_processed_state_single(
-							ministry_id=ministry_id
-						)
+			# Remove the ministry from the
+			# scrape queue and mark its page as
+			# pending processing
+			self._pop_page_scrape_queue(ministry_id)
+			self._pending_page_processing.append(
+				MinistryTaskPayload(ministry_id=ministry_id)
+			)
 
-						# Apply the discovered ministry
-						# services identifiers
-						self._state_manager.apply_ministry_services_identifier(
-							ministry_identifier=ministry_services_identifier
-						)
+			# If all pages scraped update global
+			# flag in state
+			if not self._ministries_page_scrape_ids:
+				self._state_manager.check_global_ministries_page_scraped_state()
 
-					# Check if all pages are processed, if
-					# so update the ministries services
-					# scrape queue with the discovered
-					# ministry services identifiers
-					self._state_manager.check_global_ministries_page_processed_state()
-
-					state = self._state_manager.get_state()
-					if state.ministry_pages.processed:
-						self._apply_ministry_services_to_scrape_queue()
-
-				else:
-					self._discovery_type_mismatch(
-						message=(
-							'Ministries page processing '
-							'task returned unexpected type '
-							'of discovered data.'
-						),
-						target_type='MinistryServicesIdentifiersList',
-						observed_type=type(
-							result.discovered_data
-						).__name__,
-						task_result=result,
-					)
-			else:
-				self._phase_failure(
-					message='Ministry page processing task '
-					'failed',
-					task_result=result,
-				)
+		else:
+			self._discovery_type_mismatch(
+				message=(
+					'Ministry page scraping task '
+					'returned unexpected type of '
+					'discovered data.'
+				),
+				target_type='MinistryIdentifier',
+				observed_type=type(
+					result.discovered_data
+				).__name__,
+				task_result=result,
+			)
 
-	def _r_ministries_services(
+	def _on_ministries_page_process(
 		self, result: TaskResult
 	) -> None:
 		"""
-		Reducer to handle the result of ministries services
-		scraping and processing tasks and update the state
-		accordingly.
+		Reducer to handle the result of a ministry pages
+		processing task and update the state accordingly.
 		"""
+		if not result.success:
+			self._phase_failure(
+				message='Ministry page processing task '
+				'failed',
+				task_result=result,
+			)
+			return
+
+		# Update the state to mark the ministry
+		# pages as processed in batch
+		ministry_services_identifiers_list = (
+			result.discovered_data
+		)
 		if (
-			result.task.operation
-			== TaskOperation.MINISTRIES_SERVICES_SCRAPE
+			ministry_services_identifiers_list.type
+			== 'ministry_services_identifiers_list'
 		):
-			if result.success:
-				# Update the state to mark the ministry
-				# services as scraped for the specific
-				# ministry, department and agency, and
-				# update the ministry service information
-				# with the discovered data from scraping.
-				service_scraped_identifier = (
-					result.discovered_data
+			ministry_services_identifiers = ministry_services_identifiers_list.ministry_services_identifiers  # noqa: E501
+			# Update each ministry with its
+			# processing state and the discovered
+			# services identifiers from processing
+			for (
+				ministry_services_identifier
+			) in ministry_services_identifiers:
+				ministry_id = (
+					ministry_services_identifier.ministry_id
+				)
+				# Apply processing result to state
+				self._state_manager.update_ministry_page_processed_state_single(
+					ministry_id=ministry_id
 				)
-				if isinstance(
-					service_scraped_identifier,
-					ServicesScrapedIdentifier,
-				):
-					self._state_manager.update_ministry_services_scraped_state(
-						ministry_id=service_scraped_identifier.ministry_id,
-						department_id=service_scraped_identifier.department_id,
-						agency_id=service_scraped_identifier.agency_id,
-					)
 
-					# Remove the service from the
-					# scrape queue
-					self._pop_service_scrape_queue(
-						ministry_id=service_scraped_identifier.ministry_id,
-						department_id=service_scraped_identifier.department_id,
-						agency_id=service_scraped_identifier.agency_id,
-					)
-				else:
-					self._discovery_type_mismatch(
-						message=(
-							'Ministry service scraping task'
-							'task returned unexpected type '
-							'of discovered data.'
-						),
-						target_type='ServicesScrapedIdentifier',
-						observed_type=type(
-							result.discovered_data
-						).__name__,
-						task_result=result,
-					)
-			else:
-				self._phase_failure(
-					message='Ministry service scraping '
-					'task failed',
-					task_result=result,
+				# Apply the discovered ministry
+				# services identifiers to state
+				# and the services scrape queue
+				self._state_manager.apply_ministry_services_identifier(
+					ministry_identifier=ministry_services_identifier
+				)
+				self._apply_ministry_services_to_scrape_queue(
+					ministry_services_identifier
 				)
-		elif (
-			result.task.operation
-			== TaskOperation.MINISTRIES_SERVICES_PROCESS
-		):
-			if result.success:
-				# Update the state to mark the ministry
-				# services as processed for the specific
-				# ministry, and update the ministry service
-				# information with the discovered data from
-				# processing, which includes the service IDs
-				# that were successfully processed for the
-				# ministry.
-				services_identifier = result.discovered_data
-				if isinstance(
-					services_identifier,
-					ServicesProcessedIdentifier,
-				):
-					ministry_id = (
-						services_identifier.ministry_id
-					)
-					self._state_manager.update_ministry_services_processed_state(
-						ministry_id=ministry_id,
-						department_agencies=services_identifier.department_agencies,
-					)
 
-					# Remove the ministry from the
-					# processing queue as all its services
-					# are now processed
-					self._pop_service_processing_queue(
-						ministry_id=ministry_id
-					)
+			# Drop processed ministries from the pending
+			# page processing queue
+			processed_ids = {
+				i.ministry_id
+				for i in ministry_services_identifiers
+			}
+			self._pending_page_processing = deque(
+				p
+				for p in self._pending_page_processing
+				if p.ministry_id not in processed_ids
+			)
 
-					# After each bach of ministry services
-					# is processed, check if all ministries
-					# are scraped for global flag update
-					# note this is done here so the check is
-					# done after each batch of services is
-					# processed, as opposed after when each
-					# service is scraped to avoid
-					# unnecessary checks
-					self._state_manager.check_global_ministry_services_scraped_state()
-
-					# When queue is empty, check if all
-					# ministries have their services
-					# processed for global flag update
-					if not self._ministries_services_queue:
-						self._state_manager.check_global_ministry_services_processed_state()
-				else:
-					self._discovery_type_mismatch(
-						message=(
-							'Ministry services processing '
-							'task returned unexpected type '
-							'of discovered data.'
-						),
-						target_type='ServicesProcessedIdentifier',
-						observed_type=type(
-							result.discovered_data
-						).__name__,
-						task_result=result,
-					)
-			else:
-				self._phase_failure(
-					message='Ministry services processing '
-					'task failed',
-					task_result=result,
-				)
+			# Check if all pages are processed
+			self._state_manager.check_global_ministries_page_processed_state()
 
-	def _r_finalisation(self, result: TaskResult) -> None:
+		else:
+			self._discovery_type_mismatch(
+				message=(
+					'Ministries page processing '
+					'task returned unexpected type '
+					'of discovered data.'
+				),
+				target_type='MinistryServicesIdentifiersList',
+				observed_type=type(
+					result.discovered_data
+				).__name__,
+				task_result=result,
+			)
+
+	def _on_ministries_services_scrape(
+		self, result: TaskResult
+	) -> None:
 		"""
-		Reducer to handle the result of finalisation tasks
-		and update the state accordingly.
+		Reducer to handle the result of a ministry service
+		scraping task and update the state accordingly.
 		"""
+		if not result.success:
+			self._phase_failure(
+				message='Ministry service scraping '
+				'task failed',
+				task_result=result,
+			)
+			return
+
+		# Update the state to mark the ministry
+		# services as scraped for the specific
+		# ministry, department and agency, and
+		# update the ministry service information
+		# with the discovered data from scraping.
+		service_scraped_identifier = result.discovered_data
 		if (
-			result.task.operation
-			== TaskOperation.FINALISATION_CHECKS
+			service_scraped_identifier.type
+			== 'services_scraped'
 		):
-			if result.success:
-				self._state_manager.update_finalisation_state(
-					completed=True
-				)
-			else:
-				self._phase_failure(
-					message='Finalisation task failed',
-					task_result=result,
+			self._state_manager.update_ministry_services_scraped_state(
+				ministry_id=service_scraped_identifier.ministry_id,
+				department_id=service_scraped_identifier.department_id,
+				agency_id=service_scraped_identifier.agency_id,
+			)
+
+			# Remove the service from the scrape
+			# queue and mark it as pending processing
+			service = self._pop_service_scrape_queue(
+				ministry_id=service_scraped_identifier.ministry_id,
+				department_id=service_scraped_identifier.department_id,
+				agency_id=service_scraped_identifier.agency_id,
+			)
+			if service is None:
+				service = self._service_payload_from_state(
+					service_scraped_identifier
 				)
+			if service is not None:
+				self._pending_service_processing.setdefault(
+					service.ministry_id, deque()
+				).append(service)
+		else:
+			self._discovery_type_mismatch(
+				message=(
+					'Ministry service scraping task'
+					'task returned unexpected type '
+					'of discovered data.'
+				),
+				target_type='ServicesScrapedIdentifier',
+				observed_type=type(
+					result.discovered_data
+				).__name__,
+				task_result=result,
+			)
+
+	def _on_ministries_services_process(
+		self, result: TaskResult
+	) -> None:
+		"""
+		Reducer to handle the result of a ministry services
+		processing task and update the state accordingly.
+		"""
+		if not result.success:
+			self._phase_failure(
+				message='Ministry services processing '
+				'task failed',
+				task_result=result,
+			)
+			return
+
+		# Update the state to mark the ministry
+		# services as processed for the specific
+		# ministry, and update the ministry service
+		# information with the discovered data from
+		# processing, which includes the service IDs
+		# that were successfully processed for the
+		# ministry.
+		services_identifier = result.discovered_data
+		if services_identifier.type == 'services_processed':
+			ministry_id = services_identifier.ministry_id
+			self._state_manager.update_ministry_services_processed_state(
+				ministry_id=ministry_id,
+				department_agencies=services_identifier.department_agencies,
+			)
+
+			# Remove the ministry from the
+			# processing queue as all its services
+			# are now processed
+			self._pop_service_processing_queue(
+				ministry_id=ministry_id
+			)
+			self._pending_service_processing.pop(
+				ministry_id, None
+			)
+
+			# After each bach of ministry services
+			# is processed, check if all ministries
+			# are scraped for global flag update
+			# note this is done here so the check is
+			# done after each batch of services is
+			# processed, as opposed after when each
+			# service is scraped to avoid
+			# unnecessary checks
+			self._state_manager.check_global_ministry_services_scraped_state()
+
+			# When queue is empty, check if all
+			# ministries have their services
+			# processed for global flag update
+			if not self._ministries_services_queue:
+				self._state_manager.check_global_ministry_services_processed_state()
+		else:
+			self._discovery_type_mismatch(
+				message=(
+					'Ministry services processing '
+					'task returned unexpected type '
+					'of discovered data.'
+				),
+				target_type='ServicesProcessedIdentifier',
+				observed_type=type(
+					result.discovered_data
+				).__name__,
+				task_result=result,
+			)
+
+	def _on_finalisation_checks(
+		self, result: TaskResult
+	) -> None:
+		"""
+		Reducer to handle the result of the finalisation
+		checks task and update the state accordingly.
+		"""
+		if result.success:
+			self._state_manager.update_finalisation_state(
+				completed=True
+			)
+		else:
+			self._phase_failure(
+				message='Finalisation task failed',
+				task_result=result,
+			)
 
 	def apply_task_result(self, result: TaskResult) -> None:
 		"""
 		Apply the result of a completed task
 		to update the scheduler state accordingly.
 		"""
-		# Use the task scope to determine which
+		# Use the task operation to determine which
 		# reducer to use
-		reducer = self._reducers.get(result.task.scope)
-		if reducer:
-			reducer(result)
+		handler = self._op_handlers.get(
+			result.task.operation
+		)
+		if handler:
+			handler(result)
 		else:
 			self._process_failure(
 				message=(
-					f'No reducer found for task scope: '
-					f'{result.task.scope}'
+					f'No reducer found for task operation: '
+					f'{result.task.operation}'
 				),
 				task=result.task,
 			)
@@ -5,6 +5,7 @@ tasks within the Scheduler class.
 """
 
 import logging
+from collections.abc import Iterable
 
 from scraper.schemas.scheduler_state import (
 	AgencyServicesState,
@@ -14,6 +15,7 @@ from scraper.schemas.scheduler_state import (
 )
 from scraper.schemas.scheduler_task import (
 	MinistryServicesIdentifier,
+	ScrapingPhase,
 )
 from scraper.static.paths import Paths
 from scraper.utils.files import (
@@ -39,6 +41,18 @@ class SchedulerStateManager:
 	):
 		self.state_file = Paths.TEMP_DIR / state_file_name
 		self._state = self._load_state()
+		# Index of ministries not yet complete, kept in
+		# step with the mutators that add ministries or
+		# flip their complete flag
+		self._incomplete_ministries: dict[
+			str, MinistryState
+		] = {
+			ministry_id: m
+			for ministry_id, m in (
+				self._state.ministries_detail.items()
+			)
+			if not m.complete
+		}
 
 	def _load_state(self) -> SchedulerState:
 		"""
@@ -77,6 +91,15 @@ class SchedulerStateManager:
 		"""
 		return self._state
 
+	def get_incomplete_ministries(
+		self,
+	) -> Iterable[MinistryState]:
+		"""
+		Get the ministries that are not yet complete,
+		in the order they were added to the state.
+		"""
+		return self._incomplete_ministries.values()
+
 	# --- State set methods ---
 	def apply_ministries_list_state(
 		self, ministry_ids: list[str]
@@ -92,10 +115,14 @@ class SchedulerStateManager:
 				ministry_id
 				not in self._state.ministries_detail
 			):
+				ministry_state = MinistryState(
+					ministry_id=ministry_id,
+				)
 				self._state.ministries_detail[
 					ministry_id
-				] = MinistryState(
-					ministry_id=ministry_id,
+				] = ministry_state
+				self._incomplete_ministries[ministry_id] = (
+					ministry_state
 				)
 
 	def apply_ministry_services_identifier(
@@ -162,6 +189,16 @@ class SchedulerStateManager:
 
 	# --- State update methods ---
 
+	def advance_phase(self, phase: ScrapingPhase) -> None:
+		"""
+		Advance the current phase of the scheduler once
+		all work for the previous phase is complete.
+		"""
+		self._state.current_phase = phase
+		logger.info(
+			f'Scheduler phase advanced to {phase.value}.'
+		)
+
 	def update_faq_state(
 		self,
 		scraped: bool | None = None,
@@ -480,6 +517,9 @@ class SchedulerStateManager:
 			and ministry_state.services.processed
 		):
 			ministry_state.complete = True
+			self._incomplete_ministries.pop(
+				ministry_id, None
+			)
 
 			logger.info(
 				f'Ministry {ministry_id} '
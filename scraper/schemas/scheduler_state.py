@@ -6,6 +6,8 @@ scraping process.
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scraper.schemas.scheduler_task import ScrapingPhase
+
 
 class StepCheck(BaseModel):
 	"""
@@ -138,6 +140,13 @@ class SchedulerState(BaseModel):
 		extra='forbid',
 	)
 
+	current_phase: ScrapingPhase = Field(
+		default=ScrapingPhase.FAQ,
+		description=(
+			'Earliest phase that may still have work to '
+			'schedule, used to skip completed phases'
+		),
+	)
 	faq: StepCheck = Field(
 		default_factory=StepCheck,
 		description=(
@@ -285,8 +285,21 @@ class EmptyDiscoveredData(BaseModel):
 	"""
 	Schema for tasks that do not discover any
 	new data to be passed back to the scheduler.
+	Frozen so a single instance can be shared as
+	the default for every task result.
 	"""
 
+	model_config = ConfigDict(
+		frozen=True,
+	)
+
+	type: Literal['empty'] = Field(
+		default='empty',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	empty: bool = Field(
 		default=True,
 		description=(
@@ -296,6 +309,9 @@ class EmptyDiscoveredData(BaseModel):
 	)
 
 
+_EMPTY_DISCOVERED_DATA = EmptyDiscoveredData()
+
+
 class MinistryIdentifier(BaseModel):
 	"""
 	Schema for a single ministry identifier discovered
@@ -303,6 +319,13 @@ class MinistryIdentifier(BaseModel):
 	for state updates.
 	"""
 
+	type: Literal['ministry_identifier'] = Field(
+		default='ministry_identifier',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	ministry_id: str = Field(
 		...,
 		description=(
@@ -319,6 +342,13 @@ class MinistryIdentifiers(BaseModel):
 	back to the scheduler for state updates.
 	"""
 
+	type: Literal['ministry_identifiers'] = Field(
+		default='ministry_identifiers',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	ministry_ids: list[str] = Field(
 		...,
 		description=(
@@ -386,6 +416,13 @@ class MinistryServicesIdentifier(BaseModel):
 	scheduler for state updates.
 	"""
 
+	type: Literal['ministry_services_identifier'] = Field(
+		default='ministry_services_identifier',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	ministry_id: str = Field(
 		...,
 		description=('Unique identifier for the ministry'),
@@ -408,6 +445,15 @@ class MinistryServicesIdentifiersList(BaseModel):
 	to be passed back to the scheduler for state updates.
 	"""
 
+	type: Literal['ministry_services_identifiers_list'] = (
+		Field(
+			default='ministry_services_identifiers_list',
+			description=(
+				'Discriminator tag identifying the type of '
+				'discovered data.'
+			),
+		)
+	)
 	ministry_services_identifiers: list[
 		MinistryServicesIdentifier
 	] = Field(
@@ -427,6 +473,13 @@ class ServicesScrapedIdentifier(BaseModel):
 	state updates.
 	"""
 
+	type: Literal['services_scraped'] = Field(
+		default='services_scraped',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	ministry_id: str = Field(
 		...,
 		description=(
@@ -457,6 +510,13 @@ class ServicesProcessedIdentifier(BaseModel):
 	state updates.
 	"""
 
+	type: Literal['services_processed'] = Field(
+		default='services_processed',
+		description=(
+			'Discriminator tag identifying the type of '
+			'discovered data.'
+		),
+	)
 	ministry_id: str = Field(
 		...,
 		description=(
@@ -474,15 +534,18 @@ class ServicesProcessedIdentifier(BaseModel):
 	)
 
 
-DiscoveredDataUnion = (
+DiscoveredDataUnion = Annotated[
 	MinistryIdentifier
 	| MinistryIdentifiers
 	| MinistryServicesIdentifier
 	| MinistryServicesIdentifiersList
 	| ServicesScrapedIdentifier
 	| ServicesProcessedIdentifier
-	| EmptyDiscoveredData
-)
+	| EmptyDiscoveredData,
+	Field(
+		discriminator='type',
+	),
+]
 
 
 class TaskResult(BaseModel):
@@ -508,7 +571,7 @@ class TaskResult(BaseModel):
 	)
 
 	discovered_data: DiscoveredDataUnion = Field(
-		default_factory=EmptyDiscoveredData,
+		default=_EMPTY_DISCOVERED_DATA,
 		description=(
 			'Any new data discovered during task execution '
 			'that needs to be passed back to the scheduler '
@@ -3,6 +3,7 @@ Scraping client module, this class is used to manage
 playwright browser interactions for scraping tasks.
 """
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
@@ -36,7 +37,7 @@ logger = logging.getLogger(__name__)
 
 
 class ScrapeClient:
-	def __init__(self) -> None:
+	def __init__(self, page_pool_size: int = 2) -> None:
 		self._rate_limiter = RateLimiter(
 			rate=RatePolicy(),
 			retry=RetryPolicy(),
@@ -46,6 +47,11 @@ class ScrapeClient:
 		self._browser: Browser | None = None
 		self._context: BrowserContext | None = None
 
+		# Warm pages reused across scrapes, recipes only
+		# navigate and query so pages carry no state
+		self._page_pool_size = page_pool_size
+		self._idle_pages: list[Page] = []
+
 		self._user_agent = (
 			'kenya-ecitizen-scraper/1.0 '
 			'(public research dataset; '
@@ -72,6 +78,14 @@ class ScrapeClient:
 			self._context = await self._browser.new_context(
 				user_agent=self._user_agent,
 			)
+			self._idle_pages = list(
+				await asyncio.gather(
+					*(
+						self._context.new_page()
+						for _ in range(self._page_pool_size)
+					)
+				)
+			)
 		except Exception as e:
 			await self._cleanup_partial_init()
 			raise ScrapeClientError(
@@ -91,6 +105,8 @@ class ScrapeClient:
 		await self._safe_stop_playwright()
 
 	async def _safe_close_context(self) -> None:
+		# Idle pages are closed along with their context
+		self._idle_pages.clear()
 		ctx = self._context
 		self._context = None
 		if ctx is None:
@@ -144,7 +160,8 @@ class ScrapeClient:
 		for attempt in range(1, self._max_retries + 1):
 			await self._rate_limiter.wait_turn()
 
-			page = await ctx.new_page()
+			page = await self._acquire_page(ctx)
+			reusable = False
 			try:
 				page.set_default_timeout(
 					self._page_timeout_ms
@@ -157,13 +174,15 @@ class ScrapeClient:
 					attempt=attempt,
 				)
 
-				return await self._recipe_or_retry(
+				result = await self._recipe_or_retry(
 					page=page,
 					recipe=recipe,
 					url=url,
 					task_log=task_log,
 					attempt=attempt,
 				)
+				reusable = True
+				return result
 
 			except RetryableScrapeError as e:
 				logger.warning(
@@ -183,11 +202,20 @@ class ScrapeClient:
 				raise
 
 			finally:
-				await self._safe_close_page(
-					page=page,
-					task_log=task_log,
-					url=url,
-				)
+				# Only pages that completed a scrape go back
+				# to the pool, failed ones may be unhealthy
+				if reusable:
+					await self._release_page(
+						page=page,
+						task_log=task_log,
+						url=url,
+					)
+				else:
+					await self._safe_close_page(
+						page=page,
+						task_log=task_log,
+						url=url,
+					)
 
 		raise FatalScrapeError(
 			f'All {self._max_retries} attempts exhausted.',
@@ -195,6 +223,32 @@ class ScrapeClient:
 			page_url=url,
 		)
 
+	async def _acquire_page(
+		self, ctx: BrowserContext
+	) -> Page:
+		if self._idle_pages:
+			return self._idle_pages.pop()
+		return await ctx.new_page()
+
+	async def _release_page(
+		self,
+		*,
+		page: Page,
+		task_log: str,
+		url: str,
+	) -> None:
+		if (
+			len(self._idle_pages) < self._page_pool_size
+			and not page.is_closed()
+		):
+			self._idle_pages.append(page)
+			return
+		await self._safe_close_page(
+			page=page,
+			task_log=task_log,
+			url=url,
+		)
+
 	async def _goto_or_retry(
 		self,
 		*,
@@ -1,4 +1,101 @@
+import asyncio
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+# --- Content cache --- #
+
+# Recently read or written file contents, keyed by path
+# and validated against the file's mtime and size so
+# changes made outside these helpers are never served
+_CONTENT_CACHE_MAX_ENTRIES = 64
+_CONTENT_CACHE_MAX_CHARS = 32_000_000
+
+_content_cache: OrderedDict[Path, tuple[int, int, str]] = (
+	OrderedDict()
+)
+_content_cache_chars = 0
+_content_cache_lock = threading.Lock()
+
+
+def _cache_put(
+	path: Path, stat: os.stat_result, content: str
+) -> None:
+	global _content_cache_chars
+	with _content_cache_lock:
+		old = _content_cache.pop(path, None)
+		if old is not None:
+			_content_cache_chars -= len(old[2])
+		if len(content) > _CONTENT_CACHE_MAX_CHARS:
+			return
+		_content_cache[path] = (
+			stat.st_mtime_ns,
+			stat.st_size,
+			content,
+		)
+		_content_cache_chars += len(content)
+		while (
+			len(_content_cache) > _CONTENT_CACHE_MAX_ENTRIES
+			or _content_cache_chars
+			> _CONTENT_CACHE_MAX_CHARS
+		):
+			_, evicted = _content_cache.popitem(last=False)
+			_content_cache_chars -= len(evicted[2])
+
+
+def _cache_get(
+	path: Path, stat: os.stat_result
+) -> str | None:
+	with _content_cache_lock:
+		entry = _content_cache.get(path)
+		if entry is None:
+			return None
+		mtime_ns, size, content = entry
+		if (
+			mtime_ns != stat.st_mtime_ns
+			or size != stat.st_size
+		):
+			return None
+		_content_cache.move_to_end(path)
+		return content
+
+
+def _cache_discard(path: Path) -> None:
+	global _content_cache_chars
+	with _content_cache_lock:
+		old = _content_cache.pop(path, None)
+		if old is not None:
+			_content_cache_chars -= len(old[2])
+
+
+# --- File IO pool --- #
+
+# Bounded pool shared by the async file helpers, so
+# disk work from many concurrent tasks reuses a fixed
+# set of named threads instead of the loop default
+_FILE_IO_POOL = ThreadPoolExecutor(
+	max_workers=min(32, (os.cpu_count() or 1) * 4),
+	thread_name_prefix='file-io',
+)
+
+
+async def _run_in_file_io_pool(
+	fn: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+	loop = asyncio.get_running_loop()
+	return await loop.run_in_executor(
+		_FILE_IO_POOL, partial(fn, *args, **kwargs)
+	)
+
+
+# --- File helpers --- #
 
 
 def does_file_exist(path: Path) -> bool:
@@ -11,9 +108,26 @@ def does_file_exist(path: Path) -> bool:
 def read_file(path: Path) -> str:
 	"""
 	Load a file and return its contents as a string.
-	Raises if the file does not exist.
+	Raises if the file does not exist. Unchanged files
+	are served from the in-memory content cache.
 	"""
-	return path.read_text(encoding='utf-8')
+	stat = path.stat()
+	content = _cache_get(path, stat)
+	if content is None:
+		content = path.read_text(encoding='utf-8')
+		_cache_put(path, stat, content)
+	return content
+
+
+def file_size(path: Path) -> int:
+	"""
+	Return the size of a file in bytes, or 0 if the
+	file does not exist.
+	"""
+	try:
+		return path.stat().st_size
+	except FileNotFoundError:
+		return 0
 
 
 def write_file(
@@ -26,7 +140,48 @@ def write_file(
 	Write text content to a file.
 
 	- Creates parent directories by default
-	- Overwrites existing files
+	- Overwrites existing files atomically
+	"""
+	if mkdir:
+		path.parent.mkdir(
+			parents=True,
+			exist_ok=True,
+		)
+
+	# Temporary name is per thread so concurrent
+	# writers of the same path do not collide
+	tmp_path = path.with_name(
+		f'.{path.name}.{threading.get_ident()}.tmp'
+	)
+	try:
+		tmp_path.write_text(
+			content,
+			encoding='utf-8',
+		)
+		os.replace(tmp_path, path)
+	except BaseException:
+		tmp_path.unlink(missing_ok=True)
+		raise
+	# Cache the text as read_text would return it,
+	# with universal newline translation applied
+	_cache_put(
+		path,
+		path.stat(),
+		content.replace('\r\n', '\n').replace('\r', '\n'),
+	)
+
+
+def append_file(
+	path: Path,
+	content: str,
+	*,
+	mkdir: bool = True,
+) -> None:
+	"""
+	Append text content to a file.
+
+	- Creates parent directories by default
+	- Creates the file if it does not exist
 	"""
 	if mkdir:
 		path.parent.mkdir(
@@ -34,7 +189,95 @@ def write_file(
 			exist_ok=True,
 		)
 
-	path.write_text(
+	_cache_discard(path)
+	with path.open('a', encoding='utf-8') as f:
+		f.write(content)
+
+
+def read_file_if_exists(path: Path) -> str | None:
+	"""
+	Load a file and return its contents as a string,
+	or None if the file does not exist.
+	"""
+	try:
+		return read_file(path)
+	except FileNotFoundError:
+		return None
+
+
+async def do_files_exist_async(
+	paths: Iterable[Path],
+) -> bool:
+	"""
+	Check in a single worker thread hop whether every
+	file in a batch exists on disk.
+	"""
+	paths = list(paths)
+	return await _run_in_file_io_pool(
+		lambda: all(does_file_exist(p) for p in paths)
+	)
+
+
+async def read_file_async(path: Path) -> str:
+	"""
+	Load a file in a worker thread so the event loop
+	is not blocked on disk IO.
+	"""
+	return await _run_in_file_io_pool(read_file, path)
+
+
+async def read_files_async(
+	paths: Iterable[Path],
+) -> list[str | None]:
+	"""
+	Load a batch of files in a single worker thread hop,
+	returning None in place of any missing file.
+	"""
+	paths = list(paths)
+	return await _run_in_file_io_pool(
+		lambda: [read_file_if_exists(p) for p in paths]
+	)
+
+
+async def write_file_async(
+	path: Path,
+	content: str,
+	*,
+	mkdir: bool = True,
+) -> None:
+	"""
+	Write text content to a file in a worker thread so
+	the event loop is not blocked on disk IO.
+	"""
+	await _run_in_file_io_pool(
+		write_file,
+		path,
 		content,
-		encoding='utf-8',
+		mkdir=mkdir,
 	)
+
+
+async def write_files_async(
+	files: Iterable[tuple[Path, str]],
+	*,
+	mkdir: bool = True,
+) -> None:
+	"""
+	Write a batch of (path, content) pairs in a single
+	worker thread hop, creating each parent directory
+	once.
+	"""
+	files = list(files)
+
+	def _write_all() -> None:
+		created: set[Path] = set()
+		for path, content in files:
+			if mkdir and path.parent not in created:
+				path.parent.mkdir(
+					parents=True,
+					exist_ok=True,
+				)
+				created.add(path.parent)
+			write_file(path, content, mkdir=False)
+
+	await _run_in_file_io_pool(_write_all)
@@ -4,24 +4,56 @@ within the executor component.
 """
 
 import json
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import TypeVar
 
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from scraper.utils.files import (
+	append_file,
+	does_file_exist,
+	file_size,
+	read_file,
+	write_file,
+)
+from scraper.utils.hashing import content_hash
 
 T = TypeVar('T', bound=BaseModel)
 
+# First line of a journal, naming the hash of the
+# snapshot its entries are replayed on top of
+_JOURNAL_HEADER_PREFIX = '# snapshot '
+
+
+@cache
+def _state_adapter(
+	model_cls: type[T],
+) -> TypeAdapter[dict[str, T]]:
+	"""
+	Helper function to get the cached adapter used to
+	serialise and validate a handler state dictionary
+	of the specified Pydantic model class.
+	"""
+	return TypeAdapter(dict[str, model_cls])
+
 
 def state_to_str(state: dict[str, T]) -> str:
 	"""
 	Helper function to convert a handler state
 	dictionary to a JSON string for saving to a file.
 	"""
-	return json.dumps(
-		{k: v.model_dump() for k, v in state.items()},
-		ensure_ascii=False,
-		indent=2,
+	if not state:
+		return '{}'
+	# Serialise straight to JSON in pydantic-core,
+	# skipping the intermediate dict per entry
+	model_cls = type(next(iter(state.values())))
+	return (
+		_state_adapter(model_cls)
+		.dump_json(state, indent=2)
+		.decode()
 	)
 
 
@@ -33,12 +65,145 @@ def str_to_state(
 	file back into a handler state dictionary with values
 	validated against the specified Pydantic model class.
 	"""
-	state_dict: dict[str, Any] = json.loads(state_str)
+	return _state_adapter(model_cls).validate_json(
+		state_str
+	)
 
-	return {
-		k: model_cls.model_validate(v)
-		for k, v in state_dict.items()
-	}
+
+def state_entries_to_jsonl(
+	state: dict[str, T], keys: Iterable[str]
+) -> str:
+	"""
+	Helper function to convert selected entries of a
+	handler state dictionary to JSON lines, one entry
+	per line, for appending to a state journal.
+	"""
+	return ''.join(
+		'{'
+		+ json.dumps(k, ensure_ascii=False)
+		+ ':'
+		+ state[k].model_dump_json()
+		+ '}\n'
+		for k in keys
+	)
+
+
+def apply_jsonl_to_state(
+	jsonl_str: str,
+	state: dict[str, T],
+	model_cls: type[T],
+) -> None:
+	"""
+	Helper function to replay a state journal onto a
+	handler state dictionary, later lines overriding
+	earlier ones. Replay stops at a truncated line,
+	which can only be the last one after a crash.
+	"""
+	adapter = _state_adapter(model_cls)
+	for line in jsonl_str.splitlines():
+		if not line:
+			continue
+		try:
+			entries = adapter.validate_json(line)
+		except ValidationError as e:
+			if e.errors()[0]['type'] == 'json_invalid':
+				break
+			raise
+		state.update(entries)
+
+
+def _journal_header(snapshot: str) -> str:
+	"""
+	Helper function to build the journal header line
+	tying a journal to the snapshot it extends.
+	"""
+	snapshot_hash = content_hash(snapshot)
+	return f'{_JOURNAL_HEADER_PREFIX}{snapshot_hash}\n'
+
+
+def save_journaled_state(
+	state: dict[str, T],
+	dirty_keys: set[str],
+	state_file: Path,
+	journal_file: Path,
+) -> None:
+	"""
+	Helper function to persist the changed entries of a
+	handler state. Dirty entries are appended to the
+	journal, which is compacted into a full snapshot in
+	the state file once it outgrows half the snapshot.
+	The dirty keys are cleared once saved.
+	"""
+	if not dirty_keys:
+		return
+
+	journal_size = file_size(journal_file)
+	snapshot_size = file_size(state_file)
+	if (
+		not snapshot_size
+		or not journal_size
+		or journal_size > snapshot_size // 2
+	):
+		snapshot = state_to_str(state)
+		write_file(path=state_file, content=snapshot)
+		# Snapshot now holds every entry, so the journal
+		# is reset to one tied to it. A crash before
+		# this leaves the old journal, which loading
+		# skips as it names the previous snapshot
+		write_file(
+			path=journal_file,
+			content=_journal_header(snapshot),
+		)
+	else:
+		append_file(
+			path=journal_file,
+			content=state_entries_to_jsonl(
+				state, dirty_keys
+			),
+		)
+	dirty_keys.clear()
+
+
+def load_journaled_state(
+	state_file: Path,
+	journal_file: Path,
+	model_cls: type[T],
+) -> dict[str, T]:
+	"""
+	Helper function to load a handler state from its
+	last snapshot, replaying any journal on top. A
+	journal left over from an interrupted compaction
+	names an older snapshot and is discarded.
+	"""
+	snapshot = (
+		read_file(state_file)
+		if does_file_exist(state_file)
+		else None
+	)
+	state: dict[str, T] = (
+		str_to_state(snapshot, model_cls)
+		if snapshot is not None
+		else {}
+	)
+	if not does_file_exist(journal_file):
+		return state
+
+	journal = read_file(journal_file)
+	if not journal.startswith(_JOURNAL_HEADER_PREFIX):
+		# Journal written before headers were added
+		apply_jsonl_to_state(journal, state, model_cls)
+		return state
+
+	header, _, entries = journal.partition('\n')
+	if snapshot is not None and (
+		f'{header}\n' == _journal_header(snapshot)
+	):
+		apply_jsonl_to_state(entries, state, model_cls)
+	else:
+		# Empty the stale journal so the next save
+		# compacts rather than appending to it
+		write_file(path=journal_file, content='')
+	return state
 
 
 def state_to_df(
@@ -48,12 +213,21 @@ def state_to_df(
 	Helper function to convert a handler state
 	dictionary to a pandas DataFrame for analysis.
 	"""
-	rows = [v.model_dump() for v in state.values()]
-	df = pd.DataFrame(rows)
+	columns = list(model_cls.model_fields)
+	if not state:
+		return pd.DataFrame(columns=columns)
 
-	# Enforce model field order in the DataFrame
-	# columns
-	df = df[list(model_cls.model_fields.keys())]
+	# Build column by column in the model field order.
+	# Entry fields are all scalars, so values are read
+	# straight off the models rather than dumping a
+	# dict per row
+	entries = state.values()
+	df = pd.DataFrame(
+		{
+			field: [getattr(v, field) for v in entries]
+			for field in columns
+		}
+	)
 
 	# Convert empty strings to NaN for better analysis
 	df.replace('', pd.NA, inplace=True)
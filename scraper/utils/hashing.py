@@ -34,3 +34,14 @@ def stable_id(
 	"""
 	inputs_normalised = map(normalise_text_hashing, inputs)
 	return sha256_hash('-'.join(inputs_normalised))
+
+
+def content_hash(content: str) -> str:
+	"""
+	Generates a BLAKE2b digest of raw content, used to
+	detect whether a source file changed since it was
+	last processed.
+	"""
+	return hashlib.blake2b(
+		content.encode('utf-8'), digest_size=16
+	).hexdigest()
@@ -8,9 +8,14 @@ practices.
 
 import logging
 import traceback
+from functools import lru_cache
 from pathlib import Path
 
-from scraper.schemas.scheduler_task import SchedulerTask
+from scraper.schemas.scheduler_task import (
+	SchedulerTask,
+	ScrapingPhase,
+	TaskOperation,
+)
 
 
 class SafeFormatter(logging.Formatter):
@@ -68,12 +73,20 @@ def setup_logging(
 	root.addHandler(stream_handler)
 
 
+@lru_cache(maxsize=64)
+def _format_task_log(
+	scope: ScrapingPhase, operation: TaskOperation
+) -> str:
+	return f'{scope}:{operation}'
+
+
 def get_task_log(task: SchedulerTask) -> str:
 	"""
 	Helper function to create a consistent log string
-	for a given task.
+	for a given task. The string only depends on the
+	scope and operation, so it is cached on those.
 	"""
-	return f'{task.scope}:{task.operation}'
+	return _format_task_log(task.scope, task.operation)
 
 
 def format_exception(e: BaseException) -> str:
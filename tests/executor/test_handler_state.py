@@ -0,0 +1,149 @@
+"""
+This module is used to test that handlers persisting
+their state through the state journal resume with
+their latest entries.
+"""
+
+import pytest
+
+from scraper.executor.handlers.departments_handler import (
+	DepartmentsHandler,
+)
+from scraper.executor.handlers.services_handler import (
+	ServicesHandler,
+)
+from scraper.schemas.departments import DepartmentEntry
+from scraper.schemas.scheduler_task import (
+	EmptyTask,
+	ScrapingPhase,
+	TaskOperation,
+)
+from scraper.schemas.services import ServiceEntry
+from scraper.static.paths import Paths
+from scraper.utils import handlers
+from scraper.utils.files import file_size
+
+# --- Test helpers ---
+
+TASK_LOG = 'test_handler_state'
+TASK = EmptyTask(
+	scope=ScrapingPhase.FINALISATION,
+	operation=TaskOperation.FINALISATION_CHECKS,
+)
+
+
+def _department(i: int, version: int) -> DepartmentEntry:
+	return DepartmentEntry(
+		department_id=f'department-{i}',
+		ministry_id='ministry',
+		department_name=f'Department {i}',
+		observed_agency_count=version,
+		observed_service_count=None,
+		ministry_departments_url='https://example.com',
+	)
+
+
+def _service(i: int, version: int) -> ServiceEntry:
+	return ServiceEntry(
+		service_id=f'service-{i}',
+		agency_id='agency',
+		department_id='department',
+		ministry_id='ministry',
+		service_name=f'Service {i}',
+		service_url='https://example.com',
+		service_description=f'Version {version}',
+		requirements=None,
+	)
+
+
+def _apply_departments(handler, entries):
+	handler.apply_department_entry_list(
+		entries, TASK_LOG, TASK
+	)
+
+
+def _apply_services(handler, entries):
+	handler.apply_service_entry_list(
+		entries, TASK_LOG, TASK
+	)
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+	monkeypatch.setattr(Paths, 'TEMP_DIR', tmp_path)
+	state_file = tmp_path / 'departments_handler_state.json'
+	monkeypatch.setattr(
+		DepartmentsHandler, 'state_file', state_file
+	)
+	monkeypatch.setattr(
+		DepartmentsHandler,
+		'state_journal_file',
+		state_file.with_suffix('.jsonl'),
+	)
+	return tmp_path
+
+
+# --- Test cases ---
+
+
+@pytest.mark.parametrize(
+	('handler_cls', 'entries_attr', 'apply', 'make_entry'),
+	[
+		(
+			DepartmentsHandler,
+			'department_entries',
+			_apply_departments,
+			_department,
+		),
+		(
+			ServicesHandler,
+			'service_entries',
+			_apply_services,
+			_service,
+		),
+	],
+)
+def test_handler_resumes_after_interrupted_compaction(
+	state_dir,
+	monkeypatch,
+	handler_cls,
+	entries_attr,
+	apply,
+	make_entry,
+):
+	handler = handler_cls()
+	apply(handler, [make_entry(i, 0) for i in range(10)])
+	handler.save_state()
+
+	# Journal changes until the next save compacts
+	version = 0
+	while file_size(handler.state_journal_file) <= (
+		file_size(handler.state_file) // 2
+	):
+		version += 1
+		apply(handler, [make_entry(0, version)])
+		handler.save_state()
+
+	# Crash after the compacted snapshot is written but
+	# before the journal is reset
+	apply(handler, [make_entry(0, version + 1)])
+	real_write_file = handlers.write_file
+
+	def crashing_write_file(path, content, **kwargs):
+		if path == handler.state_journal_file:
+			raise KeyboardInterrupt
+		real_write_file(path, content, **kwargs)
+
+	monkeypatch.setattr(
+		handlers, 'write_file', crashing_write_file
+	)
+	with pytest.raises(KeyboardInterrupt):
+		handler.save_state()
+	monkeypatch.setattr(
+		handlers, 'write_file', real_write_file
+	)
+
+	resumed = handler_cls()
+	assert getattr(resumed, entries_attr) == getattr(
+		handler, entries_attr
+	)
@@ -430,10 +430,7 @@ def test_scheduler_ministries_page_phase_completion():
 
 	# Check that ministry services scrape tasks have been
 	# scheduled for all ministries
-	queue_ids = {
-		mid
-		for mid, _ in scheduler._ministries_services_queue
-	}
+	queue_ids = set(scheduler._ministries_services_queue)
 	for ministry_id in TEST_MINISTRY_IDS:
 		assert ministry_id in queue_ids
 
@@ -488,10 +485,7 @@ def test_scheduler_ministries_services_phase_completion():
 
 	# Check that scrape tasks are generated for each
 	# ministry in the queue
-	queue_ids = {
-		mid
-		for mid, _ in scheduler._ministries_services_queue
-	}
+	queue_ids = set(scheduler._ministries_services_queue)
 	for (
 		ministry_service_identifier
 	) in test_ministry_services_identifiers:
@@ -592,8 +586,10 @@ def test_scheduler_ministries_services_phase_completion():
 		# services for the ministry in a batch and that
 		# state is updated accordingly
 		# Check that ministry queue is empty
-		ministry_services_queue = (
-			scheduler._ministries_services_queue[0][1]
+		ministry_services_queue = next(
+			iter(
+				scheduler._ministries_services_queue.values()
+			)
 		)
 		assert not ministry_services_queue
 
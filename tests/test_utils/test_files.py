@@ -0,0 +1,56 @@
+"""
+This module is used to test the file helper
+functions used in the application.
+"""
+
+from pathlib import Path
+
+from scraper.utils.files import (
+	read_file,
+	read_files_async,
+	write_file,
+	write_files_async,
+)
+
+# --- Test cases ---
+
+
+def test_read_file_matches_disk(tmp_path: Path):
+	path = tmp_path / 'page.html'
+
+	# Cached writes return what a disk read would
+	write_file(path=path, content='a\r\nb\rc\n')
+	assert read_file(path) == path.read_text(
+		encoding='utf-8'
+	)
+
+	# Changes made outside the helpers are picked up
+	path.write_text('changed elsewhere', encoding='utf-8')
+	assert read_file(path) == 'changed elsewhere'
+
+
+async def test_read_files_async_missing(tmp_path: Path):
+	present = tmp_path / 'present.html'
+	write_file(path=present, content='content')
+
+	contents = await read_files_async(
+		[present, tmp_path / 'missing.html']
+	)
+	assert contents == ['content', None]
+
+
+async def test_write_files_async_atomic(tmp_path: Path):
+	files = [
+		(tmp_path / 'a' / 'one.html', 'one'),
+		(tmp_path / 'a' / 'two.html', 'two'),
+		(tmp_path / 'b' / 'three.html', 'three'),
+	]
+	await write_files_async(files)
+	await write_files_async([(files[0][0], 'updated')])
+
+	assert read_file(files[0][0]) == 'updated'
+	assert read_file(files[2][0]) == 'three'
+	# No temporary files are left behind
+	assert sorted(
+		p.name for p in tmp_path.rglob('*') if p.is_file()
+	) == ['one.html', 'three.html', 'two.html']
@@ -0,0 +1,167 @@
+"""
+This module is used to test the handler state
+helper functions used in the application.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from scraper.utils import handlers
+from scraper.utils.files import file_size
+from scraper.utils.handlers import (
+	apply_jsonl_to_state,
+	load_journaled_state,
+	save_journaled_state,
+	state_entries_to_jsonl,
+	state_to_df,
+)
+
+# --- Test models ---
+
+
+class Entry(BaseModel):
+	name: str
+	count: int | None = None
+
+
+# --- Test cases ---
+
+
+def test_state_journal_round_trip():
+	state = {
+		'a': Entry(name='first'),
+		'b': Entry(name='second', count=2),
+		'c': Entry(name='third'),
+	}
+	journal = state_entries_to_jsonl(state, ['a', 'b'])
+	assert len(journal.splitlines()) == 2
+
+	# Later lines override earlier ones
+	state['a'].count = 5
+	journal += state_entries_to_jsonl(state, ['a'])
+
+	replayed = {'c': Entry(name='third')}
+	apply_jsonl_to_state(journal, replayed, Entry)
+	assert replayed == state
+
+
+def test_state_journal_truncated_line():
+	state = {
+		'a': Entry(name='first'),
+		'b': Entry(name='second'),
+	}
+	journal = state_entries_to_jsonl(state, ['a', 'b'])
+	# Simulate a crash part way through the last line
+	truncated = journal[: len(journal) - 5]
+
+	replayed: dict[str, Entry] = {}
+	apply_jsonl_to_state(truncated, replayed, Entry)
+	assert replayed == {'a': Entry(name='first')}
+
+
+def test_journaled_state_save_and_load(tmp_path):
+	state_file = tmp_path / 'state.json'
+	journal_file = tmp_path / 'state.jsonl'
+	state = {
+		'a': Entry(name='first'),
+		'b': Entry(name='second'),
+	}
+
+	# First save writes a full snapshot
+	dirty = {'a', 'b'}
+	save_journaled_state(
+		state, dirty, state_file, journal_file
+	)
+	assert not dirty
+	assert file_size(state_file)
+	# Journal only holds its snapshot header
+	assert len(journal_file.read_text().splitlines()) == 1
+
+	# Later saves only append the changed entry
+	state['b'].count = 3
+	save_journaled_state(
+		state, {'b'}, state_file, journal_file
+	)
+	assert len(journal_file.read_text().splitlines()) == 2
+
+	loaded = load_journaled_state(
+		state_file, journal_file, Entry
+	)
+	assert loaded == state
+
+
+def test_state_to_df_columns():
+	empty = state_to_df({}, Entry)
+	assert list(empty.columns) == ['name', 'count']
+	assert empty.empty
+
+	df = state_to_df(
+		{
+			'a': Entry(name='first', count=1),
+			'b': Entry(name=''),
+		},
+		Entry,
+	)
+	assert list(df.columns) == ['name', 'count']
+	assert df['name'].iloc[0] == 'first'
+	assert df['name'].isna().iloc[1]
+	assert df['count'].isna().iloc[1]
+
+
+def test_journaled_state_interrupted_compaction(
+	tmp_path, monkeypatch
+):
+	state_file = tmp_path / 'state.json'
+	journal_file = tmp_path / 'state.jsonl'
+	state = {
+		str(i): Entry(name=f'entry {i}') for i in range(10)
+	}
+	state['a'] = Entry(name='first', count=1)
+	save_journaled_state(
+		state, set(state), state_file, journal_file
+	)
+
+	# Journal changes on top of the snapshot until the
+	# next save compacts
+	while file_size(journal_file) <= (
+		file_size(state_file) // 2
+	):
+		state['a'].count += 1
+		save_journaled_state(
+			state, {'a'}, state_file, journal_file
+		)
+
+	# Crash after the compacted snapshot is written but
+	# before the journal is reset
+	state['a'].count += 1
+	real_write_file = handlers.write_file
+
+	def crashing_write_file(path, content, **kwargs):
+		if path == journal_file:
+			raise KeyboardInterrupt
+		real_write_file(path, content, **kwargs)
+
+	monkeypatch.setattr(
+		handlers, 'write_file', crashing_write_file
+	)
+	with pytest.raises(KeyboardInterrupt):
+		save_journaled_state(
+			state, {'a'}, state_file, journal_file
+		)
+	monkeypatch.undo()
+
+	# The stale journal must not revert the snapshot
+	loaded = load_journaled_state(
+		state_file, journal_file, Entry
+	)
+	assert loaded == state
+
+	# Later saves journal on top of the new snapshot
+	state['a'].count += 1
+	save_journaled_state(
+		state, {'a'}, state_file, journal_file
+	)
+	loaded = load_journaled_state(
+		state_file, journal_file, Entry
+	)
+	assert loaded == state